@@ -66,20 +66,6 @@ class BaseBuilder(abc.ABC):
 
     def _user_confirmation(self) -> bool:
         """Display build details and prompt user for confirmation with aligned output."""
-        # Determine max label length for alignment
-        labels = [
-            "Client:", "Type:", "Release Tag:", "Repository:", 
-            "Source Directory:", "Install Directory:", "Build Threads:", "Native CPU Build:",
-            "Symlink Update:", "Symlink Path:", "Symlink Target:"
-        ]
-        max_label_len = max(len(label) for label in labels)
-        padding = max_label_len + 2 # Add 2 for spacing
-        # ANSI Color Codes
-        COLOR_BOLD_GREEN = "\033[1;32m"
-        COLOR_BRIGHT_CYAN = "\033[1;36m"
-        COLOR_YELLOW = "\033[1;33m" # For the warning
-        COLOR_RESET = "\033[0m"
-
         # Define labels and calculate padding based on uncolored labels
         labels = {
             "Client:": self.client,
@@ -2,6 +2,7 @@
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
 
@@ -134,6 +135,10 @@ class Config:
         # Set the value
         config[keys[-1]] = value
         
+        # Derived lookups may depend on the changed key
+        _url_to_cluster_map.cache_clear()
+        _cluster_to_cli_url_map.cache_clear()
+        
         # Save to file if requested
         if save_path:
             return self.save(save_path)
@@ -214,13 +219,46 @@ class Config:
 # Global configuration instance
 _config_instance = None
 
+@lru_cache(maxsize=8)
+def _load_config(custom_path: Optional[str] = None) -> Config:
+    """Load a Config once per config path so repeated lookups skip TOML parsing."""
+    return Config(custom_path)
+
 def get_config(custom_path=None):
     """Get the config instance, creating it if necessary."""
     global _config_instance
     if _config_instance is None or custom_path:
-        _config_instance = Config(custom_path)
+        _config_instance = _load_config(custom_path)
     return _config_instance
 
+@lru_cache(maxsize=8)
+def _url_to_cluster_map(config: Config) -> Dict[str, str]:
+    """Build the RPC URL to cluster name lookup for a config instance."""
+    url_map = {}
+    for cluster_name, cluster_config in config.get("rpc_urls", {}).items():
+        for url in cluster_config.get("urls", []):
+            # Keep the first cluster listing a URL, matching a linear scan
+            url_map.setdefault(url, cluster_name)
+    return url_map
+
+def get_url_to_cluster_map() -> Dict[str, str]:
+    """Get a {rpc_url: cluster_name} lookup, built once from the current config."""
+    return _url_to_cluster_map(get_config())
+
+@lru_cache(maxsize=8)
+def _cluster_to_cli_url_map(config: Config) -> Dict[str, str]:
+    """Build the cluster name to solana CLI "--url" lookup for a config instance."""
+    url_map = {}
+    for cluster_name, cluster_config in config.get("rpc_urls", {}).items():
+        urls = cluster_config.get("urls", [])
+        if urls:
+            url_map[cluster_name] = urls[0]
+    return url_map
+
+def get_cluster_cli_url(cluster: str) -> str:
+    """Get the "--url" value for the solana CLI: the cluster's first RPC URL, or the cluster name itself."""
+    return _cluster_to_cli_url_map(get_config()).get(cluster, cluster)
+
 def update_config(key, value, save=False):
     """Update a configuration value."""
     config = get_config()
@@ -54,13 +54,18 @@ def setup_snap_avorio_args(parser: argparse.ArgumentParser):
     """Set up arguments for the 'snap-avorio' command."""
     parser.add_argument("cluster", choices=["um", "ut"], help="Cluster to download snapshot for (um=mainnet, ut=testnet)")
     parser.add_argument("snap_type", choices=["full", "incr", "both"], help="Type of snapshot to download (full, incr, or both)")
+    mode_group = parser.add_mutually_exclusive_group()
+    mode_group.add_argument("--exec", dest="exec_aria2c", action="store_true", help="Replace this process with aria2c once confirmed (lower memory use, no adaptive connection tuning).")
+    mode_group.add_argument("--extract", action="store_true", help="Stream each archive through curl into tar and extract it without saving the archive (requires curl, pbzip2/bzip2 or zstd).")
 
 def handle_snap_avorio_command(args: Any):
     """Handle the 'snap-avorio' command."""
     from thw_nodekit.toolkit.commands.snap_avorio import download_snapshot
     success = download_snapshot(
         cluster=args.cluster,
-        snap_type=args.snap_type
+        snap_type=args.snap_type,
+        exec_aria2c=args.exec_aria2c,
+        extract=args.extract
     )
     if not success:
         sys.exit(1) # Exit with error code if snapshot operation failed
@@ -70,6 +75,7 @@ def setup_symlink_args(parser: argparse.ArgumentParser):
     """Set up arguments for the 'symlink' command."""
     parser.add_argument("client", choices=["agave", "jito", "firedancer"], help="The client to symlink (agave, jito, or firedancer).")
     parser.add_argument("tag", help="The release tag (e.g., v1.18.2) to symlink.")
+    parser.add_argument("-y", "--yes", dest="assume_yes", action="store_true", help="Skip the confirmation prompt (THW_NODEKIT_YES=1 does the same when stdin is not a terminal).")
 
 def handle_symlink_command(args: Any):
     """Handle the 'symlink' command."""
@@ -77,7 +83,8 @@ def handle_symlink_command(args: Any):
     success = manage_symlink(
         client=args.client,
         tag=args.tag,
-        config_path=args.config if hasattr(args, "config") else None
+        config_path=args.config if hasattr(args, "config") else None,
+        assume_yes=args.assume_yes
     )
     if not success:
         # The manage_symlink function logs errors but may return True if user aborts.
@@ -2,6 +2,14 @@ import subprocess
 import sys
 import os
 import logging
+import secrets
+import shutil
+import socket
+import threading
+import time
+import certifi
+import requests
+from typing import Dict, Optional
 from thw_nodekit.config import get_config
 
 # ANSI Color Codes
@@ -11,86 +19,499 @@ C_YELLOW = "\033[1;33m"
 C_BOLD_RED = "\033[1;31m"
 C_NC = "\033[0m"
 
+# Confirmation banner pieces (invariant across calls)
+_SEPARATOR = f"{C_CYAN}{'-' * 120}{C_NC}"
+_HEADER = f"{C_GREEN}THW-NodeKit {C_CYAN}| Snapshot Download (Avorio Network){C_NC}"
+_LABELS = ("Cluster", "Snapshot Type", "Download Directory", "Source URL(s)")
+_PADDING = max(map(len, _LABELS)) + 4
+_LABEL_FMT = f"{C_CYAN}{{label:<{_PADDING}}}{C_NC}{{value}}".format
+_CONTINUATION_INDENT = " " * _PADDING
+
+# cluster -> (display name, Avorio base URL, snapshot directory config key)
+_CLUSTERS = {
+    "um": ("Mainnet", "https://snapshots.avorio.network/mainnet-beta", "toolkit.snapshot_dir_um"),
+    "ut": ("Testnet", "https://snapshots.avorio.network/testnet", "toolkit.snapshot_dir_ut"),
+}
+# snap_type -> (snapshot file names, display name)
+_SNAP_TYPES = {
+    "full": (("snapshot.tar.bz2",), "Full"),
+    "incr": (("incremental-snapshot.tar.bz2",), "Incremental"),
+    "both": (("incremental-snapshot.tar.bz2", "snapshot.tar.bz2"), "Both"),
+}
+
 logger = logging.getLogger(__name__)
 
-def download_snapshot(cluster: str, snap_type: str):
+# Download directories already created/verified by this process
+_ENSURED_DIRS = set()
+
+# Absolute path to aria2c, resolved once at import (None if not on PATH)
+_ARIA2C_PATH = shutil.which("aria2c")
+# Streaming extraction (--extract) tools; pbzip2 decompresses bz2 on all cores when installed
+_CURL_PATH = shutil.which("curl")
+_BZIP2_PATH = shutil.which("pbzip2") or shutil.which("bzip2")
+_ZSTD_PATH = shutil.which("zstd")
+
+# aria2c JSON-RPC settings used by the adaptive connection controller; the port is
+# picked per run from the free ephemeral ports
+ARIA2_RPC_URL_FMT = "http://127.0.0.1:{port}/jsonrpc"
+# Consecutive failed RPC polls (about one per second) before aria2c is terminated
+ARIA2_RPC_MAX_POLL_FAILURES = 30
+# Windows of flat throughput before the controller probes a neighbouring connection level
+ARIA2_PLATEAU_WINDOWS = 6
+# Candidate values for --max-connection-per-server (aria2c caps this option at 16)
+ARIA2_CONNECTION_LEVELS = (4, 8, 12, 16)
+# In-memory write cache for aria2c; coalesces piece writes into fewer, larger write syscalls
+ARIA2_DISK_CACHE = "64M"
+
+
+class Aria2ConnectionController(threading.Thread):
+    """
+    Adjusts aria2c's per-server connection count from live throughput samples.
+
+    Polls the aria2c RPC interface once per second, computes throughput from the
+    change in completed bytes, and hill-climbs over ARIA2_CONNECTION_LEVELS.
+    Every option change restarts the active downloads, so the controller holds
+    its level while the mean throughput of each window stays within `tolerance`
+    of the previous one, and only probes a neighbouring level once the plateau
+    has lasted ARIA2_PLATEAU_WINDOWS windows. A probe that improves throughput
+    is followed by another step the same way; one that hurts it is undone.
+
+    Since aria2c stays resident when RPC is enabled, the controller also shuts
+    aria2c down once all downloads have stopped, and terminates it if the RPC
+    interface stays unreachable for ARIA2_RPC_MAX_POLL_FAILURES polls.
+    """
+
+    def __init__(self, process: subprocess.Popen, rpc_port: int, rpc_secret: str,
+                 initial_connections: int = 16, window: int = 5,
+                 poll_interval: float = 1.0, tolerance: float = 0.05):
+        """
+        Initialize the controller.
+
+        Args:
+            process: The running aria2c process
+            rpc_port: Port aria2c's RPC server listens on (--rpc-listen-port)
+            rpc_secret: Secret token aria2c was started with (--rpc-secret)
+            initial_connections: Connection count aria2c was started with
+            window: Number of throughput samples averaged per decision
+            poll_interval: Seconds between RPC polls
+            tolerance: Relative change in throughput treated as a plateau
+        """
+        super().__init__(daemon=True)
+        self.process = process
+        self.rpc_url = ARIA2_RPC_URL_FMT.format(port=rpc_port)
+        self.rpc_token = f"token:{rpc_secret}"
+        self.level_index = ARIA2_CONNECTION_LEVELS.index(initial_connections)
+        self.direction = 1
+        self.window = window
+        self.poll_interval = poll_interval
+        self.tolerance = tolerance
+        self.samples = []
+        self.previous_mean = None
+        # Windows in a row with flat throughput, and whether the last window ended in a step
+        self.plateau_windows = 0
+        self.stepped = False
+        self.failed_downloads = []
+        self.rpc_unreachable = False
+        self._stop_event = threading.Event()
+        # Keep-alive session so each poll reuses one TCP connection to aria2c
+        self.session = requests.Session()
+
+    def _post(self, method: str, params: list):
+        """POST a JSON-RPC request to aria2c and return its result."""
+        payload = {
+            "jsonrpc": "2.0",
+            "id": "thw-nodekit",
+            "method": method,
+            "params": params,
+        }
+        response = self.session.post(self.rpc_url, json=payload, timeout=5)
+        response.raise_for_status()
+        result = response.json()
+        if "error" in result:
+            raise RuntimeError(f"aria2 RPC error: {result['error'].get('message')}")
+        return result.get("result")
+
+    def _rpc(self, method: str, *params):
+        """Call an aria2 JSON-RPC method and return its result."""
+        return self._post(method, [self.rpc_token, *params])
+
+    def _multicall(self, *calls):
+        """
+        Issue several aria2 methods in one request via system.multicall.
+
+        Args:
+            *calls: (method, params) tuples
+
+        Returns:
+            List of results in call order
+        """
+        results = self._post("system.multicall", [[
+            {"methodName": method, "params": [self.rpc_token, *params]}
+            for method, params in calls
+        ]])
+        for item in results:
+            if isinstance(item, dict):
+                raise RuntimeError(f"aria2 RPC error: {item.get('message')}")
+        return [item[0] for item in results]
+
+    def stop(self):
+        """Signal the controller to exit its polling loop."""
+        self._stop_event.set()
+
+    def run(self):
+        """Poll aria2c and adjust the connection count until downloads finish."""
+        last_bytes = None
+        last_time = None
+        poll_failures = 0
+
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                active, waiting = self._multicall(
+                    ("aria2.tellActive", [["gid", "completedLength"]]),
+                    ("aria2.tellWaiting", [0, 1, ["gid"]]),
+                )
+            except (requests.RequestException, RuntimeError, ValueError) as e:
+                # RPC server may not be listening yet, or aria2c has already exited
+                logger.debug(f"aria2 RPC poll failed: {e}")
+                poll_failures += 1
+                if poll_failures >= ARIA2_RPC_MAX_POLL_FAILURES and self.process.poll() is None:
+                    # aria2c only exits via RPC shutdown, so without RPC it would run forever
+                    logger.error(f"aria2 RPC unreachable after {poll_failures} attempts, terminating aria2c")
+                    self.rpc_unreachable = True
+                    self.process.terminate()
+                    self.session.close()
+                    return
+                continue
+            poll_failures = 0
+
+            if not active and not waiting:
+                self._finish()
+                return
+
+            now = time.monotonic()
+            completed = sum(int(d["completedLength"]) for d in active)
+            if last_bytes is not None and completed >= last_bytes:
+                self.samples.append((completed - last_bytes) / (now - last_time))
+            last_bytes, last_time = completed, now
+
+            if len(self.samples) >= self.window:
+                if self._adjust([d["gid"] for d in active]):
+                    # Active downloads restart after an option change, so re-baseline the byte counter
+                    last_bytes = None
+
+    def _adjust(self, gids) -> bool:
+        """
+        Decide whether to hold or step after a window of samples.
+
+        Args:
+            gids: GIDs of the active downloads
+
+        Returns:
+            True if the connection count was changed (active downloads restart)
+        """
+        mean = sum(self.samples) / len(self.samples)
+        self.samples = []
+        previous_mean, self.previous_mean = self.previous_mean, mean
+        stepped, self.stepped = self.stepped, False
+
+        if previous_mean is None or previous_mean <= 0:
+            return False
+
+        change = (mean - previous_mean) / previous_mean
+        if abs(change) <= self.tolerance:
+            # Plateau: hold, and only probe a neighbour once it has lasted long enough
+            self.plateau_windows += 1
+            if self.plateau_windows < ARIA2_PLATEAU_WINDOWS:
+                return False
+        elif not stepped:
+            # Throughput moved without a change on our side; don't chase network noise
+            self.plateau_windows = 0
+            return False
+        elif change < 0:
+            # The last step hurt throughput: undo it
+            self.direction = -self.direction
+        self.plateau_windows = 0
+
+        next_index = self.level_index + self.direction
+        if not 0 <= next_index < len(ARIA2_CONNECTION_LEVELS):
+            self.direction = -self.direction
+            next_index = self.level_index + self.direction
+
+        connections = ARIA2_CONNECTION_LEVELS[next_index]
+        logger.debug(f"Throughput {mean / 1024 / 1024:.2f} MiB/s, setting max-connection-per-server={connections}")
+        try:
+            self._multicall(*(
+                ("aria2.changeOption", [gid, {"max-connection-per-server": str(connections)}])
+                for gid in gids
+            ))
+        except (requests.RequestException, RuntimeError, ValueError) as e:
+            logger.debug(f"aria2 changeOption failed: {e}")
+            return False
+        self.level_index = next_index
+        self.stepped = True
+        return True
+
+    def _finish(self):
+        """Record failed downloads and shut aria2c down once the queue is empty."""
+        try:
+            stopped = self._rpc("aria2.tellStopped", 0, 1000, ["gid", "status", "errorMessage"])
+            self.failed_downloads = [d for d in stopped if d.get("status") != "complete"]
+            self._rpc("aria2.shutdown")
+        except (requests.RequestException, RuntimeError, ValueError) as e:
+            logger.error(f"Failed to finalize aria2c via RPC: {e}")
+        finally:
+            self.session.close()
+
+def _free_local_port() -> int:
+    """Ask the OS for a currently unused TCP port on the loopback interface."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _preferred_snapshot_url(base_url: str, name: str) -> str:
+    """
+    Resolve a snapshot URL, preferring a zstd-compressed variant when the CDN offers one.
+
+    zstd decompresses far faster than bzip2, so for a "*.tar.bz2" name the
+    matching "*.tar.zst" is probed with a HEAD request first; the bz2 URL is
+    used if the probe fails or the variant is missing.
+
+    Args:
+        base_url: Avorio base URL for the cluster
+        name: Snapshot file name (e.g. "snapshot.tar.bz2")
+
+    Returns:
+        URL of the snapshot to download
+    """
+    default_url = f"{base_url}/{name}"
+    if not name.endswith(".tar.bz2"):
+        return default_url
+
+    zst_url = f"{base_url}/{name[:-len('.bz2')]}.zst"
+    try:
+        response = requests.head(zst_url, allow_redirects=True, timeout=10)
+    except requests.RequestException as e:
+        logger.debug(f"zstd variant probe failed for {zst_url}: {e}")
+        return default_url
+
+    if response.status_code == 200:
+        logger.info(f"Using zstd snapshot variant: {zst_url}")
+        return zst_url
+    return default_url
+
+
+def _stream_extract(url: str, snaps_dir: str) -> bool:
+    """
+    Download a snapshot archive and extract it on the fly without writing the archive to disk.
+
+    Runs curl | <decompressor> | tar as a chain of processes, each stage's
+    stdout feeding the next stage's stdin, so network receive, decompression
+    and extraction overlap.
+
+    Args:
+        url: Snapshot archive URL (.tar.zst or .tar.bz2)
+        snaps_dir: Directory to extract into
+
+    Returns:
+        True if every stage of the pipeline exited successfully, False otherwise
+    """
+    if _CURL_PATH is None:
+        logger.error(f"curl command not found, cannot download {url}")
+        print(f"{C_BOLD_RED}Error: curl command not found, cannot download {url}{C_NC}")
+        return False
+
+    decompressor = _ZSTD_PATH if url.endswith(".zst") else _BZIP2_PATH
+    if decompressor is None:
+        tool = "zstd" if url.endswith(".zst") else "pbzip2/bzip2"
+        logger.error(f"{tool} command not found, cannot extract {url}")
+        print(f"{C_BOLD_RED}Error: {tool} command not found, cannot extract {url}{C_NC}")
+        return False
+
+    stages = (
+        [_CURL_PATH, "--fail", "--location", "--silent", "--show-error", "--output", "-", url],
+        [decompressor, "-dc"],
+        ["tar", "-xf", "-", "-C", snaps_dir],
+    )
+    logger.info(f"Executing pipeline: {' | '.join(' '.join(stage) for stage in stages)}")
+    print(f"{C_CYAN}Downloading and extracting: {url}{C_NC}")
+
+    processes = []
+    upstream = None
+    for stage in stages:
+        is_last = len(processes) == len(stages) - 1
+        try:
+            process = subprocess.Popen(stage, stdin=upstream, stdout=None if is_last else subprocess.PIPE)
+        except OSError as e:
+            # Don't leave the stages already started blocked on a pipe nobody reads
+            for started in processes:
+                started.kill()
+                started.wait()
+            if upstream is not None:
+                upstream.close()
+            logger.error(f"Failed to start {os.path.basename(stage[0])} while extracting {url}: {e}")
+            print(f"{C_BOLD_RED}Error: failed to start {os.path.basename(stage[0])}: {e}{C_NC}")
+            return False
+        if upstream is not None:
+            upstream.close()  # Let the upstream stage receive SIGPIPE if this one exits early
+        upstream = process.stdout
+        processes.append(process)
+
+    success = True
+    for stage, process in zip(stages, processes):
+        if process.wait() != 0:
+            logger.error(f"{os.path.basename(stage[0])} exited with return code {process.returncode} while extracting {url}")
+            success = False
+    return success
+
+
+def _etag_path(snaps_dir: str, url: str) -> str:
+    """Path of the local ETag manifest for a snapshot URL (e.g. snapshot.tar.zst.etag)."""
+    return os.path.join(snaps_dir, f"{url.rsplit('/', 1)[-1]}.etag")
+
+
+def _check_remote_etag(url: str, snaps_dir: str) -> Optional[str]:
+    """
+    Check a snapshot URL against its stored ETag with a conditional HEAD request.
+
+    Args:
+        url: Snapshot URL
+        snaps_dir: Download directory holding the snapshot and its .etag manifest
+
+    Returns:
+        None if the remote snapshot is unchanged and the local copy exists,
+        otherwise the remote ETag ("" if the server did not send one)
+    """
+    local_file = os.path.join(snaps_dir, url.rsplit("/", 1)[-1])
+    headers = {}
+    if os.path.exists(local_file):
+        try:
+            with open(_etag_path(snaps_dir, url)) as f:
+                headers["If-None-Match"] = f.read().strip()
+        except OSError:
+            pass
+
+    try:
+        response = requests.head(url, headers=headers, allow_redirects=True, timeout=10)
+    except requests.RequestException as e:
+        logger.debug(f"ETag check failed for {url}: {e}")
+        return ""
+
+    if response.status_code == 304:
+        return None
+    return response.headers.get("ETag", "")
+
+
+def _file_allocation_mode(snaps_dir: str) -> str:
+    """
+    Pick aria2c's --file-allocation mode for the download directory.
+
+    Probes posix_fallocate (what aria2c's 'falloc' mode uses) on a scratch file,
+    returning 'falloc' when it works and 'trunc' otherwise.
+    """
+    probe_path = os.path.join(snaps_dir, ".falloc_probe")
+    try:
+        fd = os.open(probe_path, os.O_WRONLY | os.O_CREAT, 0o600)
+        try:
+            os.posix_fallocate(fd, 0, 4096)
+        finally:
+            os.close(fd)
+            os.remove(probe_path)
+        return "falloc"
+    except (OSError, AttributeError) as e:
+        logger.debug(f"posix_fallocate unavailable in {snaps_dir}, using trunc allocation: {e}")
+        return "trunc"
+
+
+def _drop_page_cache(path: str):
+    """
+    Flush a downloaded snapshot and evict it from the page cache.
+
+    Dirty pages cannot be dropped, so the file is fdatasync'ed first; then
+    POSIX_FADV_DONTNEED releases its cached pages so a multi-GB snapshot does
+    not keep evicting the validator's working set.
+    """
+    if not hasattr(os, "posix_fadvise") or not os.path.exists(path):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.debug(f"Could not drop page cache for {path}: {e}")
+
+
+def _save_etags(snaps_dir: str, etags: Dict[str, str]):
+    """Persist ETags of successfully downloaded snapshots."""
+    for url, etag in etags.items():
+        if not etag:
+            continue
+        try:
+            with open(_etag_path(snaps_dir, url), "w") as f:
+                f.write(etag)
+        except OSError as e:
+            logger.warning(f"Could not write ETag manifest for {url}: {e}")
+
+
+def download_snapshot(cluster: str, snap_type: str, exec_aria2c: bool = False, extract: bool = False):
     """
     Downloads Solana snapshots using aria2c.
+
+    If exec_aria2c is True, the Python process is replaced by aria2c after
+    confirmation (the function does not return on success). This frees the
+    interpreter's memory for the duration of the transfer but skips the
+    adaptive connection controller and Python-side output handling.
+
+    If extract is True, each archive is instead streamed through curl into
+    the decompressor and tar, and extracted into the download directory
+    without the archive itself being written to disk.
     """
-    config = get_config()
-    cluster_map = {"um": "Mainnet", "ut": "Testnet"}
-    cluster_name = cluster_map.get(cluster, "Unknown")
-
-    if cluster == "um":
-        base_url = "https://snapshots.avorio.network/mainnet-beta"
-        snaps_dir = config.get("toolkit.snapshot_dir_um")
-    elif cluster == "ut":
-        base_url = "https://snapshots.avorio.network/testnet"
-        snaps_dir = config.get("toolkit.snapshot_dir_ut")
-    else:
+    cluster_entry = _CLUSTERS.get(cluster)
+    if cluster_entry is None:
         logger.error(f"Invalid cluster '{cluster}'. Valid options: 'um' (mainnet), 'ut' (testnet)")
         print(f"{C_BOLD_RED}Error: Invalid cluster '{cluster}'. Valid options: 'um' (mainnet), 'ut' (testnet){C_NC}")
         return False
+    cluster_name, base_url, snaps_dir_key = cluster_entry
 
-    if not snaps_dir:
-        logger.error(f"Snapshot directory for cluster '{cluster}' not configured. Please set 'toolkit.snapshot_dir_{cluster}'.")
-        print(f"{C_BOLD_RED}Error: Snapshot directory for cluster '{cluster}' not configured. Please set 'toolkit.snapshot_dir_{cluster}'.{C_NC}")
-        return False
-
-    full_snapshot_url = f"{base_url}/snapshot.tar.bz2"
-    incr_snapshot_url = f"{base_url}/incremental-snapshot.tar.bz2"
-
-    snap_urls = []
-    snap_type_display = snap_type.capitalize()
-    if snap_type == "full":
-        snap_urls.append(full_snapshot_url)
-    elif snap_type == "incr":
-        snap_urls.append(incr_snapshot_url)
-        snap_type_display = "Incremental"
-    elif snap_type == "both":
-        snap_urls.extend([incr_snapshot_url, full_snapshot_url])
-    else:
+    snap_type_entry = _SNAP_TYPES.get(snap_type)
+    if snap_type_entry is None:
         logger.error(f"Invalid snapshot type '{snap_type}'. Valid options: 'full', 'incr', 'both'.")
         print(f"{C_BOLD_RED}Error: Invalid snapshot type '{snap_type}'. Valid options: 'full', 'incr', 'both'.{C_NC}")
         return False
+    snap_files, snap_type_display = snap_type_entry
 
-    if not snap_urls:
-        logger.error("No snapshot URLs determined. This should not happen if type is valid.")
-        print(f"{C_BOLD_RED}Error: No snapshot URLs determined.{C_NC}")
+    snaps_dir = get_config().get(snaps_dir_key)
+    if not snaps_dir:
+        logger.error(f"Snapshot directory for cluster '{cluster}' not configured. Please set '{snaps_dir_key}'.")
+        print(f"{C_BOLD_RED}Error: Snapshot directory for cluster '{cluster}' not configured. Please set '{snaps_dir_key}'.{C_NC}")
         return False
 
+    if extract:
+        if _CURL_PATH is None:
+            logger.error("curl command not found.")
+            print(f"{C_BOLD_RED}Error: curl command not found. Please install curl and ensure it is on your PATH.{C_NC}")
+            return False
+    elif _ARIA2C_PATH is None:
+        logger.error("aria2c command not found.")
+        print(f"{C_BOLD_RED}Error: aria2c command not found. Please install aria2 and ensure it is on your PATH.{C_NC}")
+        return False
+
+    snap_urls = [_preferred_snapshot_url(base_url, name) for name in snap_files]
+
     # --- User Confirmation --- 
-    separator = "-" * 120
-    print(f"{C_CYAN}{separator}{C_NC}")
-    print(f"{C_GREEN}THW-NodeKit {C_CYAN}| Snapshot Download (Avorio Network){C_NC}")
-    print(f"{C_CYAN}{separator}{C_NC}")
-
-    details = {
-        "Cluster": cluster_name,
-        "Snapshot Type": snap_type_display,
-        "Download Directory": snaps_dir,
-        "Source URL(s)": "\n".join(snap_urls)
-    }
-    max_label_len = max(len(k) for k in details.keys())
-    padding = max_label_len + 4
-
-    for label, value in details.items():
-        if label == "Source URL(s)":
-            urls = value.splitlines()
-            if urls:
-                print(f"{C_CYAN}{label + ':':<{padding}}{C_NC}{urls[0]}")
-                for i in range(1, len(urls)):
-                    print(f"{'':<{padding}}{urls[i]}")
-            else:
-                print(f"{C_CYAN}{label + ':':<{padding}}{C_NC}")
-        elif "\n" in value:
-            print(f"{C_CYAN}{label + ':':<{padding}}{C_NC}{value.splitlines()[0]}")
-            for line in value.splitlines()[1:]:
-                print(f"{'':<{padding}}{line}")
-        else:
-            print(f"{C_CYAN}{label + ':':<{padding}}{C_NC}{value}")
-    
-    print(f"{C_CYAN}{separator}{C_NC}")
+    values = (cluster_name, snap_type_display, snaps_dir, snap_urls[0])
+    lines = [_SEPARATOR, _HEADER, _SEPARATOR]
+    lines.extend(
+        _LABEL_FMT(label=label + ":", value=value)
+        for label, value in zip(_LABELS, values)
+    )
+    lines.extend("".join((_CONTINUATION_INDENT, url)) for url in snap_urls[1:])
+    lines.append(_SEPARATOR)
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
     try:
         confirm = input(f"{C_GREEN}Proceed with download? (y/n): {C_NC}").strip().lower()
@@ -108,22 +529,98 @@ def download_snapshot(cluster: str, snap_type: str):
     logger.info(f"Starting download to: {snaps_dir} from URLs: {snap_urls}")
     
     try:
-        os.makedirs(snaps_dir, exist_ok=True)
+        if snaps_dir not in _ENSURED_DIRS:
+            os.makedirs(snaps_dir, exist_ok=True)
+            _ENSURED_DIRS.add(snaps_dir)
+
+        if extract:
+            for url in snap_urls:
+                if not _stream_extract(url, snaps_dir):
+                    print(f"\n{C_BOLD_RED}Error while downloading and extracting {url}{C_NC}")
+                    return False
+            logger.info("Download and extraction completed successfully.")
+            print(f"\n{C_GREEN}Download and extraction completed successfully.{C_NC}")
+            return True
+
+        # Skip snapshots whose remote ETag matches the one stored after the last download
+        etags = {}
+        for url in snap_urls:
+            etag = _check_remote_etag(url, snaps_dir)
+            if etag is None:
+                logger.info(f"Remote snapshot unchanged, skipping: {url}")
+            else:
+                etags[url] = etag
+        snap_urls = list(etags)
+        if not snap_urls:
+            print(f"{C_GREEN}Local snapshot(s) already up to date.{C_NC}")
+            return True
         
+        rpc_secret = secrets.token_hex(16)
         command = [
-            "aria2c",
+            _ARIA2C_PATH,
             "-x16",
             "-s16",
+            # Each URL is its own download session; run them all concurrently
             "--force-sequential=true",
+            f"--max-concurrent-downloads={len(snap_urls)}",
             f"--dir={snaps_dir}",
+            f"--disk-cache={ARIA2_DISK_CACHE}",
+            # Reserve contiguous extents up front rather than growing the file piece by piece
+            f"--file-allocation={_file_allocation_mode(snaps_dir)}",
+            # Reuse connections across pieces instead of re-handshaking per split
+            "--enable-http-keep-alive=true",
+            "--enable-http-pipelining=true",
+            # Only fetch when the remote snapshot is newer than the local copy
+            "--conditional-get=true",
+            "--allow-overwrite=true",
+            "--remote-time=true",
+            "--check-certificate=true",
+            f"--ca-certificate={certifi.where()}",
         ]
+
+        if exec_aria2c:
+            command.extend(snap_urls)
+            logger.info(f"Replacing process with: {' '.join(command)}")
+            sys.stdout.flush()
+            sys.stderr.flush()
+            logging.shutdown()
+            os.execv(command[0], command)
+
+        rpc_port = _free_local_port()
+        command.extend([
+            "--enable-rpc=true",
+            f"--rpc-listen-port={rpc_port}",
+            f"--rpc-secret={rpc_secret}",
+            # Throughput comes from the RPC interface; the periodic multi-line summary would only flood the output
+            "--summary-interval=0",
+        ])
         command.extend(snap_urls)
         
-        logger.info(f"Executing command: {' '.join(command)}")
+        logger.info(f"Executing command: {' '.join(c for c in command if not c.startswith('--rpc-secret'))}")
+        # aria2c writes its progress readout straight to the terminal
         process = subprocess.Popen(command, stdout=sys.stdout, stderr=sys.stderr)
-        process.wait()
+        controller = Aria2ConnectionController(process, rpc_port, rpc_secret)
+        controller.start()
+        try:
+            process.wait()
+        finally:
+            controller.stop()
+            controller.join()
+
+        if controller.rpc_unreachable:
+            print(f"\n{C_BOLD_RED}Error during download with aria2c: its RPC interface could not be reached.{C_NC}")
+            return False
+
+        if controller.failed_downloads:
+            for failed in controller.failed_downloads:
+                logger.error(f"aria2c download {failed.get('gid')} failed: {failed.get('errorMessage')}")
+            print(f"\n{C_BOLD_RED}Error during download with aria2c: {len(controller.failed_downloads)} download(s) failed.{C_NC}")
+            return False
 
         if process.returncode == 0:
+            _save_etags(snaps_dir, etags)
+            for url in snap_urls:
+                _drop_page_cache(os.path.join(snaps_dir, url.rsplit("/", 1)[-1]))
             logger.info("Download completed successfully via aria2c.")
             print(f"\n{C_GREEN}Download completed successfully.{C_NC}")
             return True
@@ -1,18 +1,24 @@
 import os
-import glob
 import requests
 import time
 import shutil
 import math
 import json
+import re
 import sys
 import logging
 import subprocess
+import threading
+import itertools
+import random
+from collections import deque, Counter
 from pathlib import Path
 from requests import ReadTimeout, ConnectTimeout, HTTPError, Timeout, ConnectionError
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 from multiprocessing.dummy import Pool as ThreadPool
 import statistics
+from operator import itemgetter
 from thw_nodekit.config import get_config
 
 # ANSI Color Codes
@@ -40,20 +46,63 @@ SORT_ORDER_CONFIG = 'latency'
 
 # Runtime State (managed by find_snapshot_and_download and helpers)
 current_slot = 0
-DISCARDED_BY_ARCHIVE_TYPE = 0
-DISCARDED_BY_LATENCY = 0
-DISCARDED_BY_SLOT = 0
-DISCARDED_BY_VERSION = 0
-DISCARDED_BY_UNKNW_ERR = 0
-DISCARDED_BY_TIMEOUT = 0
+# Discard tallies: each thread counts into its own Counter (see count_discard), summed by discarded_totals()
+_discard_counters = [] # Counters registered by threads in the current scan
+_discard_generation = 0 # Bumped by reset_discard_counters so long-lived threads start a fresh Counter
 FULL_LOCAL_SNAPSHOTS = [] 
 FULL_LOCAL_SNAP_SLOT = 0 
 unsuitable_servers = set()
+effective_max_latency = MAX_LATENCY_CONFIG # MAX_LATENCY_CONFIG, raised to the observed P90 (see record_latency)
+probe_timeout = 1 # Snapshot HEAD timeout in seconds, adapted to the observed P99 (see record_latency)
 json_data = {}
+scan_results = deque() # Candidate entries appended by probe threads; copied into json_data["rpc_nodes"] after the scan
 pbar = None 
+_pbar_counter = itertools.count(1) # Probes completed in the current scan (see get_snapshot_slot)
+PBAR_UPDATE_EVERY = 64
 wget_path = None
+aria2c_path = None
+_writable_dirs = set() # Snapshot directories already created and checked for write access by this process
+_thread_state = threading.local() # Per-thread requests.Session (see get_http_session)
 
 DEFAULT_HEADERS = {"Content-Type": "application/json"}
+# Results reused across retry attempts: cluster topology and per-URL HEAD responses
+CLUSTER_NODES_CACHE_TTL_SEC = 30
+PROBE_CACHE_TTL_SEC = 15
+_cluster_nodes_cache = (0.0, None) # (monotonic timestamp, getClusterNodes result)
+_probe_cache = {} # url -> (monotonic timestamp, HEAD response)
+# Rolling window of probe latencies (ms) from snapshot-serving RPCs; percentiles are refreshed every LATENCY_P90_INTERVAL samples
+_latency_window = deque(maxlen=512)
+_latency_samples = itertools.count(1)
+LATENCY_P90_INTERVAL = 50
+PROBE_TIMEOUT_BOUNDS_SEC = (0.25, 2.0)
+# Upper bound on bytes pulled from a candidate per speed check, requested via an HTTP Range header
+SPEED_TEST_MAX_BYTES = 64 * 1024 * 1024
+SPEED_TEST_RANGE_HEADER = {"Range": f"bytes=0-{SPEED_TEST_MAX_BYTES - 1}"}
+# measure_speed returns early once the average rate is above the minimum after SPEED_EARLY_PASS_SEC,
+# or below half of it after SPEED_EARLY_FAIL_SEC
+SPEED_EARLY_PASS_SEC = 2
+SPEED_EARLY_FAIL_SEC = 3
+# Stack size for probe worker threads (the platform default is typically 8 MiB)
+PROBE_THREAD_STACK_SIZE = 512 * 1024
+# Servers rejected by earlier runs, skipped until their entry is UNSUITABLE_CACHE_TTL_SEC old
+UNSUITABLE_CACHE_FILE = Path.home() / ".cache" / "thw-nodekit" / "unsuitable.txt"
+UNSUITABLE_CACHE_TTL_SEC = 6 * 3600
+_unsuitable_marked_at = {} # snapshot_address -> wall-clock time it was first marked unsuitable
+# Cached listing of local full snapshots, kept in the snapshot directory (see list_local_full_snapshots)
+LOCAL_SNAPSHOT_INDEX = ".thw_local_index.json"
+# Number of top candidates whose download speed is checked
+NUM_OF_RPC_TO_CHECK_SPEED = 15
+# Read size for the streaming download used when neither aria2c nor wget is installed
+DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+# Read size for the speed-check stream; large reads keep the Python loop out of the hot path
+SPEED_TEST_CHUNK_SIZE = 1 << 20
+# Slot numbers in snapshot file names, e.g. "/snapshot-<SLOT>-<HASH>.tar.zst" and
+# "/incremental-snapshot-<BASE_SLOT>-<SLOT>-<HASH>.tar.zst"
+FULL_SNAP_NAME_RE = re.compile(r"(?<!-)snapshot-(\d+)-")
+INC_SNAP_NAME_RE = re.compile(r"incremental-snapshot-(\d+)-(\d+)-")
+# Node entry flag: the full snapshot matching its incremental has not been looked up yet.
+# Internal to the run, so it is left out of snapshot_info.json.
+NEEDS_FULL_LOOKUP = "needs_full_lookup"
 logger = logging.getLogger("thw_nodekit.toolkit.snap_finder")
 
 
@@ -67,22 +116,43 @@ def convert_size(size_bytes):
    return "%s %s" % (s, size_name[i])
 
 
+def get_http_session() -> requests.Session:
+    """Return the calling thread's pooled HTTP session, creating it on first use.
+
+    Sessions are not shared between threads, so connections are only reused
+    within one thread: a probe thread's consecutive HEAD requests to the same
+    RPC share a keep-alive connection, while the speed check and download run
+    on other threads and open their own.
+    """
+    session = getattr(_thread_state, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _thread_state.session = session
+    return session
+
+
 def measure_speed(url: str, measure_time: int) -> float:
     logger.debug('measure_speed()')
     url = f'http://{url}/snapshot.tar.bz2' # Uses module global SNAPSHOT_PATH_CONFIG indirectly
     try:
-        r = requests.get(url, stream=True, timeout=measure_time+2)
+        # Cap the transfer; servers that ignore Range (200 instead of 206) are cut off at the same size below
+        r = get_http_session().get(url, stream=True, timeout=measure_time+2, headers=SPEED_TEST_RANGE_HEADER)
         r.raise_for_status()
     except requests.RequestException as e:
         logger.debug(f"Failed to connect or stream from {url} for speed test: {e}")
         return 0.0 # Cannot measure speed
 
+    min_speed_bytes = MIN_DOWNLOAD_SPEED_MB_CONFIG * 1024 * 1024
     start_time = time.monotonic_ns()
     last_time = start_time
     loaded = 0
+    total_loaded = 0
     speeds = []
     try:
-        for chunk in r.iter_content(chunk_size=81920):
+        for chunk in r.iter_content(chunk_size=SPEED_TEST_CHUNK_SIZE):
             curtime = time.monotonic_ns()
 
             worktime = (curtime - start_time) / 1000000000
@@ -91,14 +161,30 @@ def measure_speed(url: str, measure_time: int) -> float:
 
             delta = (curtime - last_time) / 1000000000
             loaded += len(chunk)
+            total_loaded += len(chunk)
+            if total_loaded >= SPEED_TEST_MAX_BYTES:
+                # The capped range ran out before the sampling finished; fast servers get
+                # here within a second or two, so rate them over the whole transfer
+                elapsed = (curtime - start_time) / 1000000000
+                return total_loaded / elapsed if elapsed > 0 else 0.0
             if delta > 1: # Calculate speed roughly every second
                 estimated_bytes_per_second = loaded * (1 / delta)
                 speeds.append(estimated_bytes_per_second)
                 last_time = curtime
                 loaded = 0
+
+                # Stop early once the verdict is clear either way
+                current_rate = total_loaded / worktime
+                if worktime >= SPEED_EARLY_PASS_SEC and current_rate >= min_speed_bytes:
+                    logger.debug(f"{url} already above minimum speed after {worktime:.1f}s")
+                    return current_rate
+                if worktime >= SPEED_EARLY_FAIL_SEC and current_rate < 0.5 * min_speed_bytes:
+                    logger.debug(f"{url} below half the minimum speed after {worktime:.1f}s")
+                    return current_rate
         if not speeds:
             return 0.0
-        return statistics.median(speeds)
+        # The first sample covers TCP slow start; leave it out when there are others
+        return statistics.median(speeds[1:] or speeds)
     except Exception as e:
         logger.debug(f"Error during speed measurement content iteration for {url}: {e}")
         return 0.0
@@ -106,33 +192,94 @@ def measure_speed(url: str, measure_time: int) -> float:
         r.close()
 
 
-def do_request(url_: str, method_: str = 'GET', data_: str = '', timeout_: int = 3,
-               headers_: dict = None):
-    global DISCARDED_BY_UNKNW_ERR
-    global DISCARDED_BY_TIMEOUT
-    
-    if headers_ is None:
-        headers_ = DEFAULT_HEADERS
+class SpeedPrefetcher(threading.Thread):
+    """
+    Measures the download speed of the best candidates found so far while the RPC scan is still running.
+
+    Only one measurement runs at a time so candidates do not compete for bandwidth.
+    main_worker reuses speeds at or above the minimum; slower results are measured
+    again there, since the scan's own traffic may have dragged them down.
+    """
+
+    def __init__(self, max_candidates: int):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            max_candidates: Maximum number of candidates to measure
+        """
+        super().__init__(daemon=True)
+        self.max_candidates = max_candidates
+        self.speeds = {} # snapshot_address -> bytes per second
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        """Signal the prefetcher to stop after the measurement in progress."""
+        self._stop_event.set()
+
+    def run(self):
+        """Measure the best unmeasured candidate until stopped or the limit is reached."""
+        while not self._stop_event.is_set() and len(self.speeds) < self.max_candidates:
+            candidates = [
+                node for node in scan_results.copy()
+                if node["snapshot_address"] not in self.speeds and node["snapshot_address"] not in unsuitable_servers
+            ]
+            if not candidates:
+                self._stop_event.wait(0.2)
+                continue
+            address = min(candidates, key=itemgetter(SORT_ORDER_CONFIG))["snapshot_address"]
+            self.speeds[address] = measure_speed(url=address, measure_time=SPEED_MEASURE_TIME_SEC_CONFIG)
+
 
+def count_discard(reason: str):
+    """Count a discarded RPC in the calling thread's own Counter (no shared global write)."""
+    counter = getattr(_thread_state, "discards", None)
+    if counter is None or _thread_state.discard_generation != _discard_generation:
+        counter = Counter()
+        _thread_state.discards = counter
+        _thread_state.discard_generation = _discard_generation
+        _discard_counters.append(counter)
+    counter[reason] += 1
+
+
+def discarded_totals() -> Counter:
+    """Sum the per-thread discard Counters of the current scan."""
+    totals = Counter()
+    for counter in list(_discard_counters):
+        totals.update(counter)
+    return totals
+
+
+def reset_discard_counters():
+    """Start new discard tallies; threads lazily register a fresh Counter on their next discard."""
+    global _discard_generation
+    _discard_generation += 1
+    _discard_counters.clear()
+
+
+def request_error(err: Exception) -> str:
+    """Count a failed request by type and return the error string callers check for."""
+    if isinstance(err, (ReadTimeout, ConnectTimeout, HTTPError, Timeout, ConnectionError)):
+        count_discard("timeout")
+    else:
+        count_discard("unknown_error")
+    return f'error in request: {err}'
+
+
+def http_head(url_: str, timeout_: float = 3):
+    """HEAD url_ on the thread's pooled session; returns the response or an error string."""
     try:
-        if method_.lower() == 'get':
-            r = requests.get(url_, headers=headers_, timeout=(timeout_, timeout_))
-        elif method_.lower() == 'post':
-            r = requests.post(url_, headers=headers_, data=data_, timeout=(timeout_, timeout_))
-        elif method_.lower() == 'head':
-            r = requests.head(url_, headers=headers_, timeout=(timeout_, timeout_))
-        else:
-            logger.error(f"Unsupported HTTP method: {method_}")
-            return f'error in do_request(): Unsupported HTTP method: {method_}'
-        return r
+        return get_http_session().head(url_, timeout=(timeout_, timeout_))
+    except Exception as e:
+        return request_error(e)
 
-    except (ReadTimeout, ConnectTimeout, HTTPError, Timeout, ConnectionError) as reqErr:
-        DISCARDED_BY_TIMEOUT += 1
-        return f'error in do_request(): {reqErr}'
-    except Exception as unknwErr:
-        DISCARDED_BY_UNKNW_ERR += 1
-        # Original code had 'reqErr' here, correcting to 'unknwErr'
-        return f'error in do_request(): {unknwErr}'
+
+def http_post(url_: str, data_: str, timeout_: int = 3):
+    """POST a JSON-RPC body to url_ on the thread's pooled session; returns the response or an error string."""
+    try:
+        return get_http_session().post(url_, headers=DEFAULT_HEADERS, data=data_, timeout=(timeout_, timeout_))
+    except Exception as e:
+        return request_error(e)
 
 
 def get_current_slot():
@@ -140,8 +287,8 @@ def get_current_slot():
     # Uses module global RPC
     d = '{"jsonrpc":"2.0","id":1, "method":"getSlot"}'
     try:
-        r = do_request(url_=RPC, method_='post', data_=d, timeout_=25)
-        if isinstance(r, str) or 'result' not in str(r.text): # Check if do_request returned error string
+        r = http_post(url_=RPC, data_=d, timeout_=25)
+        if isinstance(r, str) or 'result' not in str(r.text): # Check if http_post returned error string
             logger.error(f'Can\'t get current slot. Response: {r.text if not isinstance(r, str) else r}')
             if not isinstance(r, str): logger.debug(r.status_code)
             return None
@@ -152,193 +299,420 @@ def get_current_slot():
 
 
 def get_all_rpc_ips():
-    global DISCARDED_BY_VERSION
     logger.debug("get_all_rpc_ips()")
     # Uses module globals RPC, WILDCARD_VERSION_CONFIG, SPECIFIC_VERSION_CONFIG, WITH_PRIVATE_RPC_CONFIG
-    d = '{"jsonrpc":"2.0", "id":1, "method":"getClusterNodes"}'
-    r = do_request(url_=RPC, method_='post', data_=d, timeout_=25)
-
-    if isinstance(r, str) or 'result' not in str(r.text):
-        logger.error(f'Can\'t get RPC ip addresses. Response: {r.text if not isinstance(r, str) else r}')
-        return [] # Return empty list on failure
+    global _cluster_nodes_cache
+    cached_at, cluster_nodes = _cluster_nodes_cache
+    if cluster_nodes is None or time.monotonic() - cached_at >= CLUSTER_NODES_CACHE_TTL_SEC:
+        d = '{"jsonrpc":"2.0", "id":1, "method":"getClusterNodes"}'
+        r = http_post(url_=RPC, data_=d, timeout_=25)
+
+        if isinstance(r, str) or 'result' not in str(r.text):
+            logger.error(f'Can\'t get RPC ip addresses. Response: {r.text if not isinstance(r, str) else r}')
+            return set() # Return empty set on failure
+        try:
+            cluster_nodes = r.json()["result"]
+        except Exception as e:
+            logger.error(f"Error decoding cluster nodes in get_all_rpc_ips: {e}")
+            return set()
+        _cluster_nodes_cache = (time.monotonic(), cluster_nodes)
+    else:
+        logger.debug("Using cached getClusterNodes result")
 
-    rpc_ips = []
+    rpc_ips = set()
     try:
-        for node in r.json()["result"]:
+        for node in cluster_nodes:
             node_version = node.get("version")
             if (WILDCARD_VERSION_CONFIG is not None and node_version and WILDCARD_VERSION_CONFIG not in node_version) or \
                (SPECIFIC_VERSION_CONFIG is not None and node_version and node_version != SPECIFIC_VERSION_CONFIG):
-                DISCARDED_BY_VERSION += 1
+                count_discard("version")
                 continue
             
             node_rpc = node.get("rpc")
             if node_rpc:
-                rpc_ips.append(node_rpc)
+                rpc_ips.add(node_rpc)
             elif WITH_PRIVATE_RPC_CONFIG:
                 gossip_ip_port = node.get("gossip")
                 if gossip_ip_port:
                     gossip_ip = gossip_ip_port.split(":")[0]
-                    rpc_ips.append(f'{gossip_ip}:8899')
+                    rpc_ips.add(f'{gossip_ip}:8899')
     except Exception as e:
         logger.error(f"Error processing cluster nodes in get_all_rpc_ips: {e}")
-        return []
-
+        return set()
 
-    rpc_ips = list(set(rpc_ips))
     logger.debug(f'RPC_IPS LEN {len(rpc_ips)}')
     # IP_BLACKLIST functionality removed
     return rpc_ips
 
 
+def probe_head(url: str, timeout_: float = 1):
+    """HEAD a snapshot URL, reusing a successful response from the last PROBE_CACHE_TTL_SEC seconds.
+
+    Args:
+        url: Snapshot URL to probe
+        timeout_: Connect/read timeout in seconds
+
+    Returns:
+        The response, or an error string as returned by http_head
+    """
+    cached = _probe_cache.get(url)
+    if cached is not None and time.monotonic() - cached[0] < PROBE_CACHE_TTL_SEC:
+        return cached[1]
+    r = http_head(url_=url, timeout_=timeout_)
+    if not isinstance(r, str):
+        _probe_cache[url] = (time.monotonic(), r)
+    return r
+
+
+def record_latency(latency_ms: float):
+    """Add a probe latency to the rolling window and periodically refresh the adaptive limits.
+
+    The latency cut-off is MAX_LATENCY_CONFIG or the P90 of recently observed
+    latencies, whichever is higher, so RPCs from a distant vantage point are
+    not all discarded. The HEAD timeout is 1.5x the observed P99, clamped to
+    PROBE_TIMEOUT_BOUNDS_SEC, so dead nodes are given up on sooner.
+    """
+    global effective_max_latency, probe_timeout
+    _latency_window.append(latency_ms)
+    if next(_latency_samples) % LATENCY_P90_INTERVAL == 0:
+        percentiles = statistics.quantiles(list(_latency_window), n=100)
+        effective_max_latency = max(MAX_LATENCY_CONFIG, percentiles[89])
+        min_timeout, max_timeout = PROBE_TIMEOUT_BOUNDS_SEC
+        probe_timeout = min(max(percentiles[98] * 1.5 / 1000, min_timeout), max_timeout)
+
+
 def get_snapshot_slot(rpc_address: str):
-    global pbar, DISCARDED_BY_ARCHIVE_TYPE, DISCARDED_BY_LATENCY, DISCARDED_BY_SLOT, json_data
-    # Uses module globals MAX_LATENCY_CONFIG, current_slot, MAX_SNAPSHOT_AGE_IN_SLOTS_CONFIG, FULL_LOCAL_SNAP_SLOT
+    global pbar
+    # Uses module globals effective_max_latency, current_slot, MAX_SNAPSHOT_AGE_IN_SLOTS_CONFIG, FULL_LOCAL_SNAP_SLOT
 
-    if pbar: pbar.update(1)
+    # Batch progress updates so probe threads rarely take tqdm's lock
+    if pbar and next(_pbar_counter) % PBAR_UPDATE_EVERY == 0: pbar.update(PBAR_UPDATE_EVERY)
     url = f'http://{rpc_address}/snapshot.tar.bz2'
     inc_url = f'http://{rpc_address}/incremental-snapshot.tar.bz2'
     
     try:
-        r_inc = do_request(url_=inc_url, method_='head', timeout_=1)
+        r_inc = probe_head(inc_url, probe_timeout)
         if not isinstance(r_inc, str): # Check if request was successful
-            if 'location' in r_inc.headers and r_inc.elapsed.total_seconds() * 1000 > MAX_LATENCY_CONFIG:
-                DISCARDED_BY_LATENCY += 1
+            snap_location_inc = r_inc.headers.get("location")
+            latency_ms = r_inc.elapsed.total_seconds() * 1000.0
+            if snap_location_inc is not None:
+                record_latency(latency_ms)
+            if snap_location_inc is not None and latency_ms > effective_max_latency:
+                count_discard("latency")
                 return None
 
-            if 'location' in r_inc.headers:
-                snap_location_inc = r_inc.headers["location"]
+            if snap_location_inc is not None:
                 if snap_location_inc.endswith('.tar'): # Filter uncompressed
-                    DISCARDED_BY_ARCHIVE_TYPE += 1
+                    count_discard("archive_type")
                     return None
                 
-                parts = snap_location_inc.split("-")
-                if len(parts) > 3: # Basic check for expected format
-                    try:
-                        incremental_base_slot = int(parts[2])
-                        tip_snap_slot = int(parts[3])
-                        slots_diff_tip = current_slot - tip_snap_slot
-
-                        if slots_diff_tip < -100: # Too far in future
-                            DISCARDED_BY_SLOT += 1
-                            return None
-                        if slots_diff_tip > MAX_SNAPSHOT_AGE_IN_SLOTS_CONFIG:
-                            DISCARDED_BY_SLOT += 1
-                            return None
-
-                        if FULL_LOCAL_SNAP_SLOT == incremental_base_slot:
-                            json_data["rpc_nodes"].append({
-                                "snapshot_address": rpc_address,
-                                "slots_diff": slots_diff_tip, # Relative to tip of incremental
-                                "latency": r_inc.elapsed.total_seconds() * 1000,
-                                "files_to_download": [snap_location_inc]
-                            })
-                            return None # Found suitable incremental
-
-                        # Incremental found, but not matching local full, check for corresponding full
-                        r_full_for_inc = do_request(url_=url, method_='head', timeout_=1)
-                        if not isinstance(r_full_for_inc, str) and 'location' in r_full_for_inc.headers:
-                            json_data["rpc_nodes"].append({
-                                "snapshot_address": rpc_address,
-                                "slots_diff": slots_diff_tip, # Still using incremental's tip slot diff
-                                "latency": r_inc.elapsed.total_seconds() * 1000, # Latency of incremental check
-                                "files_to_download": [snap_location_inc, r_full_for_inc.headers['location']],
-                            })
-                            return None
-                    except (ValueError, IndexError) as e:
-                        logger.debug(f"Error parsing incremental snapshot name {snap_location_inc}: {e}")
-                        # Fall through to full snapshot check
-                else:
+                m = INC_SNAP_NAME_RE.search(snap_location_inc)
+                if m is not None:
+                    incremental_base_slot = int(m[1])
+                    tip_snap_slot = int(m[2])
+                    slots_diff_tip = current_slot - tip_snap_slot
+
+                    if slots_diff_tip < -100: # Too far in future
+                        count_discard("slot")
+                        return None
+                    if slots_diff_tip > MAX_SNAPSHOT_AGE_IN_SLOTS_CONFIG:
+                        count_discard("slot")
+                        return None
+
+                    if FULL_LOCAL_SNAP_SLOT == incremental_base_slot:
+                        scan_results.append({
+                            "snapshot_address": rpc_address,
+                            "slots_diff": slots_diff_tip, # Relative to tip of incremental
+                            "latency": latency_ms,
+                            "files_to_download": [snap_location_inc]
+                        })
+                        return None # Found suitable incremental
+
+                    # Incremental found, but not matching local full. The corresponding full is
+                    # only looked up (in main_worker) if this node makes it to the speed check.
+                    scan_results.append({
+                        "snapshot_address": rpc_address,
+                        "slots_diff": slots_diff_tip, # Still using incremental's tip slot diff
+                        "latency": latency_ms, # Latency of incremental check
+                        "files_to_download": [snap_location_inc], # The full snapshot is appended once looked up
+                        NEEDS_FULL_LOOKUP: True,
+                    })
+                    return None
+                else: # Fall through to full snapshot check
                     logger.debug(f"Incremental snapshot name format unexpected: {snap_location_inc}")
 
 
         # Check for full snapshot if no suitable incremental path taken
-        r_full = do_request(url_=url, method_='head', timeout_=1)
-        if not isinstance(r_full, str) and 'location' in r_full.headers:
-            snap_location_full = r_full.headers["location"]
+        r_full = probe_head(url, probe_timeout)
+        snap_location_full = None if isinstance(r_full, str) else r_full.headers.get("location")
+        if snap_location_full is not None:
+            latency_ms = r_full.elapsed.total_seconds() * 1000.0
+            record_latency(latency_ms)
             if snap_location_full.endswith('.tar'):
-                DISCARDED_BY_ARCHIVE_TYPE += 1
+                count_discard("archive_type")
                 return None
             
-            parts = snap_location_full.split("-")
-            if len(parts) > 2: # snapshot-SLOT-HASH...
-                try:
-                    full_snap_slot_val = int(parts[1])
-                    slots_diff_full = current_slot - full_snap_slot_val
-                    if slots_diff_full <= MAX_SNAPSHOT_AGE_IN_SLOTS_CONFIG and r_full.elapsed.total_seconds() * 1000 <= MAX_LATENCY_CONFIG:
-                        json_data["rpc_nodes"].append({
-                            "snapshot_address": rpc_address,
-                            "slots_diff": slots_diff_full,
-                            "latency": r_full.elapsed.total_seconds() * 1000,
-                            "files_to_download": [snap_location_full]
-                        })
-                        return None
-                    else: # Did not meet age or latency for full
-                        if slots_diff_full > MAX_SNAPSHOT_AGE_IN_SLOTS_CONFIG : DISCARDED_BY_SLOT += 1
-                        if r_full.elapsed.total_seconds() * 1000 > MAX_LATENCY_CONFIG : DISCARDED_BY_LATENCY +=1
-
-                except (ValueError, IndexError) as e:
-                    logger.debug(f"Error parsing full snapshot name {snap_location_full}: {e}")
+            m = FULL_SNAP_NAME_RE.search(snap_location_full)
+            if m is not None:
+                slots_diff_full = current_slot - int(m[1])
+                if slots_diff_full <= MAX_SNAPSHOT_AGE_IN_SLOTS_CONFIG and latency_ms <= effective_max_latency:
+                    scan_results.append({
+                        "snapshot_address": rpc_address,
+                        "slots_diff": slots_diff_full,
+                        "latency": latency_ms,
+                        "files_to_download": [snap_location_full]
+                    })
+                    return None
+                else: # Did not meet age or latency for full
+                    if slots_diff_full > MAX_SNAPSHOT_AGE_IN_SLOTS_CONFIG : count_discard("slot")
+                    if latency_ms > effective_max_latency : count_discard("latency")
+            else:
+                logger.debug(f"Full snapshot name format unexpected: {snap_location_full}")
         return None # No suitable snapshot found or error
 
     except Exception: # Catch-all for unexpected issues in this function
-        # DISCARDED_BY_UNKNW_ERR implicitly handled by do_request for network errors
+        # Network errors are already counted by request_error
         return None
 
 
+def download_cmd(url_to_download: str, temp_fname: str) -> list:
+    """Build the command that downloads a snapshot to temp_fname.
+
+    Prefers aria2c, which splits the transfer across 16 parallel range requests,
+    and falls back to a single-stream wget when aria2c is not installed.
+
+    Args:
+        url_to_download: Snapshot URL
+        temp_fname: Path to download to
+
+    Returns:
+        Command line as a list of arguments
+    """
+    if aria2c_path is not None:
+        cmd = [
+            aria2c_path, '-x16', '-s16', '--min-split-size=64M', '--file-allocation=none',
+            '--allow-overwrite=true', '--auto-file-renaming=false', '--summary-interval=0',
+            f'--dir={os.path.dirname(temp_fname)}', f'--out={os.path.basename(temp_fname)}', url_to_download
+        ]
+        if MAX_DOWNLOAD_SPEED_MB_CONFIG is not None:
+            cmd.insert(1, f'--max-overall-download-limit={MAX_DOWNLOAD_SPEED_MB_CONFIG}M')
+        return cmd
+
+    cmd = [wget_path, '--progress=dot:giga', '--trust-server-names', url_to_download, f'-O{temp_fname}']
+    if MAX_DOWNLOAD_SPEED_MB_CONFIG is not None:
+        cmd.insert(1, f'--limit-rate={MAX_DOWNLOAD_SPEED_MB_CONFIG}M')
+    return cmd
+
+
+def preallocate(fd: int, size: int):
+    """Reserve size bytes for an open file up front so writes land in contiguous extents.
+
+    Failure is not an error; the file then simply grows as it is written.
+    """
+    if not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError as e:
+        logger.debug(f"posix_fallocate failed, file will grow incrementally: {e}")
+
+
+def download_stream(url_to_download: str, temp_fname: str) -> bool:
+    """Stream a snapshot to temp_fname over the thread's pooled session.
+
+    Last resort when neither aria2c nor wget is installed.
+
+    Args:
+        url_to_download: Snapshot URL
+        temp_fname: Path to download to
+
+    Returns:
+        True if the whole response body was written, False otherwise
+    """
+    max_rate = MAX_DOWNLOAD_SPEED_MB_CONFIG * 1024 * 1024 if MAX_DOWNLOAD_SPEED_MB_CONFIG is not None else None
+    try:
+        with get_http_session().get(url_to_download, stream=True, timeout=(10, 60)) as r:
+            r.raise_for_status()
+            total = int(r.headers.get("content-length", 0)) or None
+            start_time = time.monotonic()
+            written = 0
+            with open(temp_fname, "wb", buffering=0) as f, \
+                 tqdm(total=total, unit="B", unit_scale=True, unit_divisor=1024, desc=os.path.basename(url_to_download)) as progress:
+                if total is not None:
+                    preallocate(f.fileno(), total)
+                for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    written += len(chunk)
+                    progress.update(len(chunk))
+                    if max_rate is not None: # Sleep off any lead over the configured rate limit
+                        ahead = written / max_rate - (time.monotonic() - start_time)
+                        if ahead > 0:
+                            time.sleep(ahead)
+        if total is not None and written != total:
+            logger.error(f"Download of {url_to_download} ended early: {written} of {total} bytes")
+            return False
+        return True
+    except (requests.RequestException, OSError) as e:
+        logger.error(f"Streaming download of {url_to_download} failed: {e}")
+        return False
+
+
+def drop_page_cache(path: str):
+    """Flush a downloaded snapshot and evict it from the page cache.
+
+    Dirty pages cannot be dropped, so the file is fdatasync'ed before
+    POSIX_FADV_DONTNEED; a 50+ GB archive then does not push the validator's
+    working set out of memory.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.debug(f"Could not drop page cache for {path}: {e}")
+
+
 def download(url_to_download: str):
-    # Uses module globals SNAPSHOT_PATH_CONFIG, MAX_DOWNLOAD_SPEED_MB_CONFIG, wget_path
+    # Uses module globals SNAPSHOT_PATH_CONFIG, MAX_DOWNLOAD_SPEED_MB_CONFIG, aria2c_path, wget_path
     fname = url_to_download[url_to_download.rfind('/'):].replace("/", "")
     temp_fname = f'{SNAPSHOT_PATH_CONFIG}/tmp-{fname}'
     final_fname = f'{SNAPSHOT_PATH_CONFIG}/{fname}'
-    
-    cmd = [wget_path, '--progress=dot:giga', '--trust-server-names', url_to_download, f'-O{temp_fname}']
-    if MAX_DOWNLOAD_SPEED_MB_CONFIG is not None:
-        cmd.insert(1, f'--limit-rate={MAX_DOWNLOAD_SPEED_MB_CONFIG}M')
+    cmd = download_cmd(url_to_download, temp_fname) if aria2c_path is not None or wget_path is not None else None
+    tool = os.path.basename(cmd[0]) if cmd is not None else "HTTP stream"
 
     try:
-        logger.info(f"Downloading {url_to_download} (via wget)")
-        # Allow wget to print directly to terminal by removing stdout/stderr PIPE
-        process = subprocess.run(cmd, universal_newlines=True, check=False)
-        
-        if process.returncode == 0:
-            logger.info(f"wget successfully downloaded to {temp_fname}")
+        logger.info(f"Downloading {url_to_download} (via {tool})")
+        if cmd is not None:
+            # Allow the downloader to print directly to terminal by removing stdout/stderr PIPE
+            process = subprocess.run(cmd, universal_newlines=True, check=False)
+            success = process.returncode == 0
+            if not success:
+                logger.error(f"{tool} failed for {url_to_download}. Return code: {process.returncode}")
+        else:
+            success = download_stream(url_to_download, temp_fname)
+
+        if success:
+            logger.info(f"Successfully downloaded to {temp_fname}")
             logger.info(f'Renaming downloaded file {temp_fname} to {final_fname}')
             os.rename(temp_fname, final_fname)
+            drop_page_cache(final_fname)
             return True, final_fname # Return success and the final filename
         else:
-            logger.error(f"wget failed for {url_to_download}. Return code: {process.returncode}")
-            # Output is now directly on terminal, no need to log process.stdout/stderr
             if os.path.exists(temp_fname): # Clean up partial download
                 os.remove(temp_fname)
             return False, None # Return failure and no filename
             
     except Exception as e:
-        logger.error(f'Exception in download() func for {url_to_download}. Make sure wget is installed and path is correct.\n{e}')
+        logger.error(f'Exception in download() func for {url_to_download} (via {tool}).\n{e}')
         if os.path.exists(temp_fname):
             os.remove(temp_fname)
         return False, None # Return failure and no filename
 
 
+def load_unsuitable_servers() -> set:
+    """Load unexpired entries from UNSUITABLE_CACHE_FILE ("<address> <timestamp>" per line)."""
+    _unsuitable_marked_at.clear()
+    try:
+        lines = UNSUITABLE_CACHE_FILE.read_text().splitlines()
+    except OSError:
+        return set()
+
+    now = time.time()
+    for line in lines:
+        try:
+            address, marked_at = line.split()
+            marked_at = float(marked_at)
+        except ValueError:
+            continue
+        if now - marked_at < UNSUITABLE_CACHE_TTL_SEC:
+            _unsuitable_marked_at[address] = marked_at
+    logger.debug(f"Loaded {len(_unsuitable_marked_at)} unsuitable servers from {UNSUITABLE_CACHE_FILE}")
+    return set(_unsuitable_marked_at)
+
+
+def save_unsuitable_servers():
+    """Write unsuitable_servers to UNSUITABLE_CACHE_FILE, keeping each server's original timestamp."""
+    now = time.time()
+    try:
+        UNSUITABLE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        UNSUITABLE_CACHE_FILE.write_text("".join(
+            f"{address} {_unsuitable_marked_at.setdefault(address, now)}\n" for address in sorted(unsuitable_servers)
+        ))
+    except OSError as e:
+        logger.warning(f"Could not write {UNSUITABLE_CACHE_FILE}: {e}")
+
+
+def list_local_full_snapshots():
+    """List local full snapshot archives (snapshot-*tar*), newest modification time first.
+
+    The listing is cached in LOCAL_SNAPSHOT_INDEX inside the snapshot directory
+    and reused while the directory's mtime is unchanged (i.e. no file has been
+    added, removed or renamed). Otherwise it is rebuilt with a single
+    os.scandir pass; each matching entry is stat'ed once via its DirEntry.
+    """
+    index_path = os.path.join(SNAPSHOT_PATH_CONFIG, LOCAL_SNAPSHOT_INDEX)
+    try:
+        dir_mtime_ns = os.stat(SNAPSHOT_PATH_CONFIG).st_mtime_ns
+        with open(index_path) as f:
+            index = json.load(f)
+        if index["dir_mtime_ns"] == dir_mtime_ns:
+            return [os.path.join(SNAPSHOT_PATH_CONFIG, entry["name"]) for entry in index["snapshots"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass # Missing, unreadable or stale index; rebuild below
+
+    try:
+        with os.scandir(SNAPSHOT_PATH_CONFIG) as entries:
+            snapshots = [
+                (entry.stat(follow_symlinks=False).st_mtime, entry.name)
+                for entry in entries
+                if entry.name.startswith("snapshot-") and "tar" in entry.name
+            ]
+    except OSError as e:
+        logger.warning(f"Could not list local snapshots in {SNAPSHOT_PATH_CONFIG}: {e}")
+        return []
+    snapshots.sort(reverse=True)
+
+    try:
+        # Create the index file first so that writing its contents doesn't change the directory mtime recorded in it
+        open(index_path, "a").close()
+        index = {
+            "dir_mtime_ns": os.stat(SNAPSHOT_PATH_CONFIG).st_mtime_ns,
+            "snapshots": [{"name": name, "mtime": mtime} for mtime, name in snapshots],
+        }
+        with open(index_path, "w") as f:
+            json.dump(index, f)
+    except OSError as e:
+        logger.debug(f"Could not write local snapshot index {index_path}: {e}")
+
+    return [os.path.join(SNAPSHOT_PATH_CONFIG, name) for _, name in snapshots]
+
+
 def main_worker():
-    global pbar, FULL_LOCAL_SNAPSHOTS, FULL_LOCAL_SNAP_SLOT, unsuitable_servers, json_data
+    global pbar, _pbar_counter, FULL_LOCAL_SNAPSHOTS, FULL_LOCAL_SNAP_SLOT, unsuitable_servers, json_data
     # Uses module globals: RPC, SNAPSHOT_PATH_CONFIG, THREADS_COUNT_CONFIG, current_slot,
     # MAX_SNAPSHOT_AGE_IN_SLOTS_CONFIG, MIN_DOWNLOAD_SPEED_MB_CONFIG, MAX_DOWNLOAD_SPEED_MB_CONFIG,
     # SPEED_MEASURE_TIME_SEC_CONFIG, MAX_LATENCY_CONFIG, SORT_ORDER_CONFIG,
     # SPECIFIC_VERSION_CONFIG, WILDCARD_VERSION_CONFIG, WITH_PRIVATE_RPC_CONFIG
     
     try:
-        rpc_nodes = list(set(get_all_rpc_ips())) # Uses various _CONFIG globals
+        # get_all_rpc_ips() is already de-duplicated; servers rejected on an earlier attempt are not probed again
+        rpc_nodes = list(get_all_rpc_ips() - unsuitable_servers) # Uses various _CONFIG globals
         if not rpc_nodes:
             logger.warning("No RPC nodes found or failed to retrieve them. Check RPC endpoint and network.")
             return 1 # Failure
 
         if pbar: pbar.close() # Close previous pbar if any
         pbar = tqdm(total=len(rpc_nodes), desc="Scanning RPCs")
+        _pbar_counter = itertools.count(1)
         logger.info(f'RPC servers in total: {len(rpc_nodes)} | Current slot number: {current_slot}\n')
 
-        FULL_LOCAL_SNAPSHOTS = glob.glob(f'{SNAPSHOT_PATH_CONFIG}/snapshot-*tar*')
+        FULL_LOCAL_SNAPSHOTS = list_local_full_snapshots()
         if len(FULL_LOCAL_SNAPSHOTS) > 0:
-            FULL_LOCAL_SNAPSHOTS.sort(key=os.path.getmtime, reverse=True) # Sort by modification time
             try:
                 # Assuming snapshot-SLOT-HASH... format
                 FULL_LOCAL_SNAP_SLOT = int(Path(FULL_LOCAL_SNAPSHOTS[0]).name.split("-")[1])
@@ -351,24 +725,44 @@ def main_worker():
             FULL_LOCAL_SNAP_SLOT = 0
 
         logger.info(f'Searching for snapshot info on {len(rpc_nodes)} RPCs...')
-        if THREADS_COUNT_CONFIG > 0 :
-            pool = ThreadPool(THREADS_COUNT_CONFIG)
-            pool.map(get_snapshot_slot, rpc_nodes) # get_snapshot_slot appends to global json_data
-            pool.close()
-            pool.join()
-        else: # Sequential for debugging or if threads_count is 0/1
-             for node in rpc_nodes: get_snapshot_slot(node)
-
-        if pbar: pbar.close()
-
-        logger.info(f'Found suitable RPCs: {len(json_data.get("rpc_nodes", []))}')
-        logger.info(f'Discarded counts: ArchiveType={DISCARDED_BY_ARCHIVE_TYPE}, Latency={DISCARDED_BY_LATENCY}, Slot={DISCARDED_BY_SLOT}, Version={DISCARDED_BY_VERSION}, Timeout={DISCARDED_BY_TIMEOUT}, UnknownError={DISCARDED_BY_UNKNW_ERR}')
+        scan_results.clear()
+        # Start speed-checking early candidates while the rest of the scan is still in flight
+        prefetcher = SpeedPrefetcher(NUM_OF_RPC_TO_CHECK_SPEED)
+        prefetcher.start()
+        try:
+            if THREADS_COUNT_CONFIG > 0 :
+                # No point blocking more threads in recv() than there are RPCs to probe.
+                # Probe threads only make plain HTTP HEAD requests, so they get a small stack.
+                default_stack_size = threading.stack_size(PROBE_THREAD_STACK_SIZE)
+                try:
+                    pool = ThreadPool(min(THREADS_COUNT_CONFIG, len(rpc_nodes)))
+                finally:
+                    threading.stack_size(default_stack_size)
+                pool.map(get_snapshot_slot, rpc_nodes) # get_snapshot_slot appends to scan_results
+                pool.close()
+                pool.join()
+            else: # Sequential for debugging or if threads_count is 0/1
+                 for node in rpc_nodes: get_snapshot_slot(node)
+        finally:
+            prefetcher.stop()
+            prefetcher.join()
+        json_data["rpc_nodes"] = list(scan_results)
+
+        if pbar:
+            pbar.update(pbar.total - pbar.n) # Flush the remainder of the last batch
+            pbar.close()
+
+        logger.info(f'Found suitable RPCs: {len(json_data.get("rpc_nodes", []))} (latency cut-off: {effective_max_latency:.0f}ms)')
+        discarded = discarded_totals()
+        logger.info(f'Discarded counts: ArchiveType={discarded["archive_type"]}, Latency={discarded["latency"]}, Slot={discarded["slot"]}, Version={discarded["version"]}, Timeout={discarded["timeout"]}, UnknownError={discarded["unknown_error"]}')
 
         if not json_data.get("rpc_nodes"):
             logger.warning(f'No snapshot nodes found matching criteria (Max Age: {MAX_SNAPSHOT_AGE_IN_SLOTS_CONFIG} slots).')
             return 1 # Failure
 
-        rpc_nodes_sorted = sorted(json_data["rpc_nodes"], key=lambda k: k.get(SORT_ORDER_CONFIG, float('inf')))
+        # Sort once, in place: snapshot_info.json lists the nodes best-first and the speed check
+        # walks the same order. Every node entry carries both sort keys ("latency" and "slots_diff").
+        json_data["rpc_nodes"].sort(key=itemgetter(SORT_ORDER_CONFIG))
         
         # Update json_data structure (as original script did)
         json_data.update({
@@ -376,31 +770,53 @@ def main_worker():
             "last_update_slot": current_slot,
             "total_rpc_nodes_scanned": len(rpc_nodes), # Renamed for clarity
             "rpc_nodes_with_potential_snapshot": len(json_data["rpc_nodes"]), # Renamed
-            "rpc_nodes": rpc_nodes_sorted # Overwrite with sorted list
         })
 
         try:
             with open(f'{SNAPSHOT_PATH_CONFIG}/snapshot_info.json', "w") as result_f: # Renamed file
-                json.dump(json_data, result_f, indent=2)
+                json.dump({
+                    **json_data,
+                    "rpc_nodes": [
+                        {key: value for key, value in node.items() if key != NEEDS_FULL_LOOKUP}
+                        for node in json_data["rpc_nodes"]
+                    ],
+                }, result_f, indent=2)
             logger.info(f'Snapshot metadata saved to {SNAPSHOT_PATH_CONFIG}/snapshot_info.json')
         except IOError as e:
             logger.warning(f"Could not write snapshot_info.json: {e}")
 
 
-        num_of_rpc_to_check_speed = 15 
-        logger.info(f"Attempting to measure speed and download from up to {num_of_rpc_to_check_speed} top candidates...")
+        logger.info(f"Attempting to measure speed and download from up to {NUM_OF_RPC_TO_CHECK_SPEED} top candidates...")
 
-        for i, rpc_node_info in enumerate(rpc_nodes_sorted[:num_of_rpc_to_check_speed], start=1):
+        checked = 0
+        for rpc_node_info in json_data["rpc_nodes"]:
             # Blacklist functionality for specific snapshot files/hashes removed.
-            
+            if checked >= NUM_OF_RPC_TO_CHECK_SPEED:
+                break
+
             snapshot_address = rpc_node_info["snapshot_address"]
-            logger.info(f'{i}/{len(rpc_nodes_sorted)} Checking speed for {snapshot_address} (Latency: {rpc_node_info.get("latency", "N/A"):.2f}ms, Slot Diff: {rpc_node_info.get("slots_diff", "N/A")})')
-            
             if snapshot_address in unsuitable_servers:
                 logger.info(f'Skipping {snapshot_address}, already marked unsuitable.')
                 continue
 
-            down_speed_bytes = measure_speed(url=snapshot_address, measure_time=SPEED_MEASURE_TIME_SEC_CONFIG)
+            if rpc_node_info.get(NEEDS_FULL_LOOKUP):
+                r_full = http_head(url_=f'http://{snapshot_address}/snapshot.tar.bz2', timeout_=2)
+                if isinstance(r_full, str) or 'location' not in r_full.headers:
+                    # Not persisted as unsuitable: the full snapshot may simply not be served yet.
+                    # The node doesn't use up a speed-check slot, so the next candidate takes its place.
+                    logger.info(f'Skipping {snapshot_address}, no full snapshot available for its incremental.')
+                    continue
+                rpc_node_info["files_to_download"].append(r_full.headers["location"])
+                del rpc_node_info[NEEDS_FULL_LOOKUP]
+
+            checked += 1
+            logger.info(f'{checked}/{NUM_OF_RPC_TO_CHECK_SPEED} Checking speed for {snapshot_address} (Latency: {rpc_node_info.get("latency", "N/A"):.2f}ms, Slot Diff: {rpc_node_info.get("slots_diff", "N/A")})')
+
+            down_speed_bytes = prefetcher.speeds.get(snapshot_address, 0.0)
+            if down_speed_bytes >= MIN_DOWNLOAD_SPEED_MB_CONFIG * 1024 * 1024:
+                logger.info(f'Using speed measured during the scan for {snapshot_address}.')
+            else:
+                down_speed_bytes = measure_speed(url=snapshot_address, measure_time=SPEED_MEASURE_TIME_SEC_CONFIG)
             if down_speed_bytes == 0.0:
                  logger.warning(f"Speed measurement failed or result is zero for {snapshot_address}.")
                  unsuitable_servers.add(snapshot_address)
@@ -440,7 +856,7 @@ def main_worker():
                 if "incremental-snapshot" in Path(file_path_suffix).name.lower():
                     logger.info(f"Refreshing incremental snapshot link for {snapshot_address}...")
                     fresh_inc_head_url = f'http://{snapshot_address}/incremental-snapshot.tar.bz2'
-                    r_fresh_inc = do_request(url_=fresh_inc_head_url, method_='head', timeout_=2)
+                    r_fresh_inc = http_head(url_=fresh_inc_head_url, timeout_=2)
                     if not isinstance(r_fresh_inc, str) and 'location' in r_fresh_inc.headers:
                         fresh_location = r_fresh_inc.headers["location"]
                         # Ensure the base slot of the fresh incremental still matches FULL_LOCAL_SNAP_SLOT if it's set
@@ -508,7 +924,7 @@ def run_snap_finder(cluster_arg: str, verbose: bool = False):
     global MAX_SNAPSHOT_AGE_IN_SLOTS_CONFIG, WITH_PRIVATE_RPC_CONFIG 
     global THREADS_COUNT_CONFIG, MIN_DOWNLOAD_SPEED_MB_CONFIG, MAX_DOWNLOAD_SPEED_MB_CONFIG
     global SPEED_MEASURE_TIME_SEC_CONFIG, MAX_LATENCY_CONFIG, SNAPSHOT_PATH_CONFIG, SORT_ORDER_CONFIG
-    global wget_path, current_slot 
+    global wget_path, aria2c_path, current_slot 
 
     config = get_config()
 
@@ -544,7 +960,10 @@ def run_snap_finder(cluster_arg: str, verbose: bool = False):
     SORT_ORDER_CONFIG = 'latency'
     
     _NUM_OF_MAX_ATTEMPTS = 5
-    _SLEEP_BEFORE_RETRY = 7
+    # Exponential backoff between attempts: 2s, 4s, 8s, ... capped, plus jitter
+    _SLEEP_BASE = 2
+    _SLEEP_CAP = 30
+    _SLEEP_JITTER = 0.5
 
     # Logging Setup
     log_level = logging.DEBUG if verbose else logging.INFO
@@ -594,23 +1013,33 @@ def run_snap_finder(cluster_arg: str, verbose: bool = False):
 
     # Moved these log messages to after confirmation, if proceeding
     logger.info(f"Proceeding with Snap Finder for cluster: {cluster_arg.upper()}, Target RPC: {RPC}, Path: {SNAPSHOT_PATH_CONFIG}")
-    logger.debug(f"Verbose logging enabled. Using up to {_NUM_OF_MAX_ATTEMPTS} attempts, {_SLEEP_BEFORE_RETRY}s sleep between attempts.")
+    logger.debug(f"Verbose logging enabled. Using up to {_NUM_OF_MAX_ATTEMPTS} attempts, exponential backoff from {_SLEEP_BASE}s (max {_SLEEP_CAP}s) between attempts.")
     logger.debug(f"Scan Params: Threads={THREADS_COUNT_CONFIG}, MaxAgeSlots={MAX_SNAPSHOT_AGE_IN_SLOTS_CONFIG}, MinSpeedMBps={MIN_DOWNLOAD_SPEED_MB_CONFIG}, MaxLatencyMs={MAX_LATENCY_CONFIG}")
 
-    try:
-        Path(SNAPSHOT_PATH_CONFIG).mkdir(parents=True, exist_ok=True)
-        with open(f'{SNAPSHOT_PATH_CONFIG}/.write_perm_test', 'w') as f_: # Hidden file
-            f_.write("test")
-        os.remove(f'{SNAPSHOT_PATH_CONFIG}/.write_perm_test')
-    except IOError as e:
-        logger.error(f"Write permission test failed for '{SNAPSHOT_PATH_CONFIG}': {e}")
-        return False
-
-    wget_path_check = shutil.which("wget")
-    if wget_path_check is None:
-        logger.error("wget utility not found in system PATH. It is required for downloading snapshots.")
-        return False
-    wget_path = wget_path_check 
+    if SNAPSHOT_PATH_CONFIG not in _writable_dirs:
+        try:
+            Path(SNAPSHOT_PATH_CONFIG).mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.error(f"Could not create snapshot directory '{SNAPSHOT_PATH_CONFIG}': {e}")
+            return False
+        if not os.access(SNAPSHOT_PATH_CONFIG, os.W_OK | os.X_OK):
+            logger.error(f"Write permission test failed for '{SNAPSHOT_PATH_CONFIG}': directory is not writable.")
+            return False
+        _writable_dirs.add(SNAPSHOT_PATH_CONFIG)
+
+    aria2c_path = shutil.which("aria2c")
+    wget_path = shutil.which("wget")
+    if aria2c_path is None and wget_path is None:
+        logger.info("Neither aria2c nor wget found in system PATH. Snapshots will be downloaded over a single HTTP stream.")
+
+    global unsuitable_servers, _cluster_nodes_cache
+    unsuitable_servers = load_unsuitable_servers() # Kept across attempts (and runs) so rejected servers are skipped
+    _cluster_nodes_cache = (0.0, None)
+    _probe_cache.clear()
+    global effective_max_latency, probe_timeout
+    effective_max_latency = MAX_LATENCY_CONFIG
+    probe_timeout = 1
+    _latency_window.clear()
 
     num_attempts_made = 0
     while num_attempts_made < _NUM_OF_MAX_ATTEMPTS:
@@ -618,14 +1047,11 @@ def run_snap_finder(cluster_arg: str, verbose: bool = False):
         logger.info(f"Snapshot search: Attempt {num_attempts_made}/{_NUM_OF_MAX_ATTEMPTS}")
 
         # Reset per-attempt module-level state variables
-        global DISCARDED_BY_ARCHIVE_TYPE, DISCARDED_BY_LATENCY, DISCARDED_BY_SLOT, DISCARDED_BY_VERSION
-        global DISCARDED_BY_UNKNW_ERR, DISCARDED_BY_TIMEOUT, FULL_LOCAL_SNAPSHOTS, FULL_LOCAL_SNAP_SLOT
-        global unsuitable_servers, json_data, pbar
+        global FULL_LOCAL_SNAPSHOTS, FULL_LOCAL_SNAP_SLOT
+        global json_data, pbar
 
-        DISCARDED_BY_ARCHIVE_TYPE = 0; DISCARDED_BY_LATENCY = 0; DISCARDED_BY_SLOT = 0
-        DISCARDED_BY_VERSION = 0; DISCARDED_BY_UNKNW_ERR = 0; DISCARDED_BY_TIMEOUT = 0
+        reset_discard_counters()
         FULL_LOCAL_SNAPSHOTS = []; FULL_LOCAL_SNAP_SLOT = 0
-        unsuitable_servers = set()
         json_data = {"rpc_nodes": []} 
         if pbar: pbar.close(); pbar = None
 
@@ -637,8 +1063,9 @@ def run_snap_finder(cluster_arg: str, verbose: bool = False):
             if slot_val is None:
                 logger.warning("Failed to get current slot for this attempt.")
                 if num_attempts_made >= _NUM_OF_MAX_ATTEMPTS: break 
-                logger.info(f"Sleeping for {_SLEEP_BEFORE_RETRY}s before next attempt to get slot.")
-                time.sleep(_SLEEP_BEFORE_RETRY)
+                retry_delay = min(_SLEEP_CAP, _SLEEP_BASE * 2 ** (num_attempts_made - 1)) + random.uniform(0, _SLEEP_JITTER)
+                logger.info(f"Sleeping for {retry_delay:.1f}s before next attempt to get slot.")
+                time.sleep(retry_delay)
                 continue 
             current_slot = slot_val
 
@@ -647,6 +1074,8 @@ def run_snap_finder(cluster_arg: str, verbose: bool = False):
         except KeyboardInterrupt:
             logger.info("Operation cancelled by user (KeyboardInterrupt).")
             return False
+        finally:
+            save_unsuitable_servers()
 
 
         if worker_result == 0: 
@@ -661,8 +1090,9 @@ def run_snap_finder(cluster_arg: str, verbose: bool = False):
 
         if num_attempts_made >= _NUM_OF_MAX_ATTEMPTS: break
 
-        logger.info(f"Sleeping for {_SLEEP_BEFORE_RETRY}s before next attempt.")
-        time.sleep(_SLEEP_BEFORE_RETRY)
+        retry_delay = min(_SLEEP_CAP, _SLEEP_BASE * 2 ** (num_attempts_made - 1)) + random.uniform(0, _SLEEP_JITTER)
+        logger.info(f"Sleeping for {retry_delay:.1f}s before next attempt.")
+        time.sleep(retry_delay)
 
     logger.error(f"Failed to find and download a suitable snapshot after {_NUM_OF_MAX_ATTEMPTS} attempts.")
     print(f"{C_BOLD_RED}Failed to find and download a suitable snapshot after {_NUM_OF_MAX_ATTEMPTS} attempts.{C_NC}")
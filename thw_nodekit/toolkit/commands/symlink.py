@@ -1,5 +1,7 @@
 import logging
 import os
+import re
+import stat
 import sys
 from pathlib import Path
 import subprocess
@@ -16,41 +18,56 @@ C_YELLOW = "\033[1;33m"
 C_BOLD_RED = "\033[1;31m"
 C_NC = "\033[0m"
 
+# Setting this to "1" skips the confirmation prompt when stdin is not a terminal (automation)
+ASSUME_YES_ENV = "THW_NODEKIT_YES"
+
 def _create_symlink_internal(target_path_str: str, link_path_str: str) -> bool:
     """
     Creates a symlink, ensuring target exists and handling pre-existing links.
     Mimics 'ln --force --symbolic'. --no-dereference is implicitly handled by
     unlinking first if link_path exists.
     """
-    target_path = Path(target_path_str).resolve() # Resolve to ensure it's absolute and exists
     link_path = Path(link_path_str)
 
-    logger.info(f"Attempting to create symlink: {link_path} -> {target_path}")
+    logger.info(f"Attempting to create symlink: {link_path} -> {target_path_str}")
 
-    if not target_path.exists():
-        logger.error(f"ERROR: Symlink target does not exist: {target_path}")
+    # One stat (following symlinks) answers both "exists" and "is a directory"
+    try:
+        target_st = os.stat(target_path_str)
+    except OSError as e: # Missing, a path component is a file, or no permission to traverse
+        logger.error(f"ERROR: Symlink target does not exist or is not accessible: {target_path_str} ({e.strerror})")
         return False
-    if not target_path.is_dir(): # Assuming target should always be a directory based on usage
-        logger.error(f"ERROR: Symlink target is not a directory: {target_path}")
+    if not stat.S_ISDIR(target_st.st_mode): # Assuming target should always be a directory based on usage
+        logger.error(f"ERROR: Symlink target is not a directory: {target_path_str}")
         return False
+    target_path = os.path.realpath(target_path_str) # Absolute, symlink-free target
 
     try:
         # Ensure parent directory of the link exists
         link_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Mimic "ln --force": remove existing link_path if it exists
-        if link_path.exists() or link_path.is_symlink(): # Check is_symlink for broken symlinks
-            logger.info(f"Removing existing file/symlink at {link_path}")
-            if link_path.is_dir() and not link_path.is_symlink(): # Don't remove a real directory
+        # Mimic "ln --force": remove existing link_path if it exists.
+        # A single lstat covers regular files, directories and (possibly broken) symlinks.
+        try:
+            link_st = os.lstat(link_path)
+        except FileNotFoundError:
+            link_st = None
+
+        if link_st is not None:
+            if stat.S_ISDIR(link_st.st_mode): # Don't remove a real directory (lstat never reports a symlink as one)
                 logger.error(
                     f"ERROR: Path {link_path} is an existing directory, not a symlink. "
                     f"Please remove it manually if you intend to replace it with a symlink."
                 )
                 return False
-            link_path.unlink(missing_ok=True) # missing_ok in case it's a broken symlink removed by another process
+            logger.info(f"Removing existing file/symlink at {link_path}")
+            try:
+                os.unlink(link_path)
+            except FileNotFoundError: # Removed by another process in the meantime
+                pass
 
         # Create the symlink. target_is_directory=True is good practice.
-        link_path.symlink_to(target_path, target_is_directory=True)
+        os.symlink(target_path, link_path, target_is_directory=True)
 
         logger.info(f"Successfully created symlink: {link_path} -> {target_path}")
         return True
@@ -78,44 +95,64 @@ def _verify_versions(client: str, expected_tag: str, symlink_path_str: str):
         commands_to_check.append({"cmd": ["solana", "--version"], "expect_tag": False}) # solana --version might be generic
         commands_to_check.append({"cmd": ["fdctl", "version"], "expect_tag": True})   # fdctl version should match tag
 
+    # Strip leading 'v' and extract the base version part (e.g., "2.1.21" from "v2.1.21-mod" or "v2.1.21-jito")
+    base_version_to_check = expected_tag.lstrip('v').split('-')[0]
+    # Match the version as a whole, so "2.1.2" does not match "2.1.21" nor "2.1.21" match "2.1.210"
+    base_version_re = re.compile(rf"(?<![\d.]){re.escape(base_version_to_check)}(?!\.?\d)")
+
     all_checks_passed = True
 
+    # Start every version command up front so their process start-up overlaps, then collect results in order
+    running = []
     for item in commands_to_check:
         cmd = item["cmd"]
-        expect_tag_in_output = item["expect_tag"]
         cmd_str = " ".join(cmd)
         logger.info(f"Running: {cmd_str}")
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False, timeout=10)
-            output = result.stdout.strip() if result.stdout else ""
-            stderr_output = result.stderr.strip() if result.stderr else ""
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except FileNotFoundError:
+            logger.error(f"Error: Command '{cmd[0]}' not found. Ensure it is in your PATH.")
+            all_checks_passed = False
+            # If a crucial command is missing, no point continuing checks for it.
+            if (cmd[0] == "fdctl" and client == "firedancer") or (cmd[0] == "solana" and client != "firedancer"):
+                for _, started in running:
+                    started.kill()
+                    started.communicate()
+                return False
+            continue
+        except Exception as e:
+            logger.error(f"An unexpected error occurred while running '{cmd_str}': {e}")
+            all_checks_passed = False
+            continue
+        running.append((item, process))
 
-            if result.returncode == 0:
-                logger.info(f"Output: {output}")
-                if expect_tag_in_output:
-                    # Strip leading 'v'
-                    tag_without_v = expected_tag.lstrip('v') 
-                    # Extract the base version part (e.g., "2.1.21" from "2.1.21-mod" or "2.1.21-jito")
-                    base_version_to_check = tag_without_v.split('-')[0]
+    for item, process in running:
+        cmd = item["cmd"]
+        expect_tag_in_output = item["expect_tag"]
+        cmd_str = " ".join(cmd)
+        try:
+            stdout, stderr = process.communicate(timeout=10)
+            # Version output is tiny; decode it once rather than through a text-mode pipe
+            output = stdout.decode("utf-8", errors="replace").strip() if stdout else ""
+            stderr_output = stderr.decode("utf-8", errors="replace").strip() if stderr else ""
 
-                    if base_version_to_check not in output:
+            if process.returncode == 0:
+                logger.info(f"Output ({cmd_str}): {output}")
+                if expect_tag_in_output:
+                    if not base_version_re.search(output):
                         logger.warning(
                             f"WARNING: Expected base version '{base_version_to_check}' (derived from input tag '{expected_tag}') "
                             f"not found in '{cmd_str}' output: \"{output}\"."
                         )
                         all_checks_passed = False
             else:
-                logger.error(f"Failed to run '{cmd_str}'. Return code: {result.returncode}")
+                logger.error(f"Failed to run '{cmd_str}'. Return code: {process.returncode}")
                 if stderr_output:
                     logger.error(f"Stderr: {stderr_output}")
                 all_checks_passed = False
-        except FileNotFoundError:
-            logger.error(f"Error: Command '{cmd[0]}' not found. Ensure it is in your PATH.")
-            all_checks_passed = False
-            # If a crucial command is missing, no point continuing checks for it.
-            if cmd[0] == "fdctl" and client == "firedancer": return False 
-            if cmd[0] == "solana" and client != "firedancer": return False
         except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
             logger.error(f"Error: Command '{cmd_str}' timed out.")
             all_checks_passed = False
         except Exception as e:
@@ -129,9 +166,18 @@ def _verify_versions(client: str, expected_tag: str, symlink_path_str: str):
     return all_checks_passed
 
 
-def manage_symlink(client: str, tag: str, config_path: Optional[str] = None) -> bool:
+def manage_symlink(client: str, tag: str, config_path: Optional[str] = None, assume_yes: bool = False) -> bool:
     """
     Manages the creation of a symlink for a given Solana client and tag.
+
+    Args:
+        client: Client name (agave, jito or firedancer)
+        tag: Release tag to point the symlink at
+        config_path: Optional custom config file path
+        assume_yes: Skip the confirmation prompt (also implied by THW_NODEKIT_YES=1 without a TTY)
+
+    Returns:
+        False if the update failed, True otherwise (including a user abort)
     """
     if not client:
         logger.error(f"ERROR: Client cannot be empty.")
@@ -198,15 +244,21 @@ def manage_symlink(client: str, tag: str, config_path: Optional[str] = None) ->
     
     print(f"{C_CYAN}{separator}{C_NC}") # Use full separator
     
-    try:
-        confirm = input(f"{C_GREEN}Proceed with update? (y/n): {C_NC}")
-        if confirm.lower() != 'y':
-            logger.warning("Symlink update aborted by user.")
-            # Exiting successfully as it's a user choice, not an error.
-            return True 
-    except EOFError: # Handle non-interactive environments
-        logger.warning("EOFError reading input (non-interactive environment?). Aborting symlink update for safety.")
-        return False # Abort if no confirmation can be obtained.
+    if not assume_yes and not sys.stdin.isatty() and os.environ.get(ASSUME_YES_ENV) == "1":
+        assume_yes = True
+
+    if assume_yes:
+        logger.info("Confirmation skipped (assume yes).")
+    else:
+        try:
+            confirm = input(f"{C_GREEN}Proceed with update? (y/n): {C_NC}")
+            if confirm.lower() != 'y':
+                logger.warning("Symlink update aborted by user.")
+                # Exiting successfully as it's a user choice, not an error.
+                return True 
+        except EOFError: # Handle non-interactive environments
+            logger.warning("EOFError reading input (non-interactive environment?). Aborting symlink update for safety.")
+            return False # Abort if no confirmation can be obtained.
 
     # Perform symlink update
     print(f"STATUS: Creating symlink to '{symlink_path_str}'")
@@ -8,7 +8,7 @@ there's no direct RPC equivalent available.
 import subprocess
 import json
 from typing import Any, Dict, List, Optional, Union
-from thw_nodekit.config import get_config
+from thw_nodekit.config import get_cluster_cli_url
 
 def execute_solana_command(command: List[str], cluster: Optional[str] = None) -> str:
     """
@@ -30,31 +30,22 @@ def execute_solana_command(command: List[str], cluster: Optional[str] = None) ->
         
         # Add cluster parameter if provided
         if cluster:
-            # Get config to determine the URL
-            config = get_config()
-            urls = config.get("rpc_urls", {}).get(cluster, {}).get("urls", [])
-            if urls:
-                # Use the first URL for the CLI command
-                full_command.extend(["--url", urls[0]])
-            else:
-                # Use the cluster name directly (solana CLI can understand um/ut)
-                full_command.extend(["--url", cluster])
+            full_command.extend(["--url", get_cluster_cli_url(cluster)])
             
         # Add the actual command parts
         full_command.extend(command)
         
-        # Execute command and capture output
+        # Execute command and capture raw output, decoded once
         result = subprocess.run(
             full_command,
             capture_output=True,
-            text=True,
             check=True
         )
-        return result.stdout
+        return result.stdout.decode("utf-8", errors="replace")
         
     except subprocess.CalledProcessError as e:
         # If command failed, include error output in exception
-        error_msg = e.stderr if e.stderr else str(e)
+        error_msg = e.stderr.decode("utf-8", errors="replace") if e.stderr else str(e)
         raise RuntimeError(f"Solana CLI command failed: {error_msg}")
     except Exception as e:
         # Handle any other exceptions
@@ -64,6 +55,9 @@ def get_validator_info_cli(cluster: Optional[str] = None) -> List[Dict[str, Any]
     """
     Get validator information using the Solana CLI.
     
+    RPC_Methods.get_validator_info reads the same data over JSON-RPC and
+    only falls back to this when the RPC path fails.
+    
     Args:
         cluster: Cluster identifier ('um' for mainnet, 'ut' for testnet)
         
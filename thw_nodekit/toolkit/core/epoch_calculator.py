@@ -4,10 +4,42 @@ Solana epoch calculation and analysis.
 Provides metrics and utilities for working with Solana epoch data.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional
 from thw_nodekit.toolkit.core import rpc_api
 
+def avg_slot_time(cluster: Optional[str], num_samples: int, decay: float = 1.0) -> float:
+    """
+    Calculate average slot time from recent performance samples.
+    
+    The samples come from the RPC client's cache (30 second TTL), so calling
+    this on every dashboard refresh does not refetch them.
+    
+    Args:
+        cluster: Optional cluster name to use for RPC calls
+        num_samples: Number of performance samples to use
+        decay: Weight factor applied per sample, newest first; 1.0 weighs all samples equally
+        
+    Returns:
+        Average slot time in seconds
+    """
+    performance_samples = rpc_api.get_recent_performance_samples(num_samples, cluster)
+    
+    # Weighted average of slot times in a single pass, skipping samples with 0 slots
+    total_slots = 0.0
+    total_time = 0.0
+    weight = 1.0
+    for sample in performance_samples:
+        num_slots = sample["numSlots"]
+        if num_slots > 0:
+            total_slots += weight * num_slots
+            total_time += weight * sample["samplePeriodSecs"]
+        weight *= decay
+    
+    # Solana's target slot time as fallback
+    return total_time / total_slots if total_slots > 0 else 0.4
+
 
 class EpochCalculator:
     """
@@ -57,11 +89,16 @@ class EpochCalculator:
         # Calculate time remaining
         remaining_slots = slots_in_epoch - slot_index
         time_remaining_seconds = remaining_slots * avg_slot_time
-        time_remaining = str(timedelta(seconds=round(time_remaining_seconds)))
+        # Same text as str(timedelta(seconds=...)), e.g. "1 day, 2:03:04", without building timedeltas
+        days, rem = divmod(round(time_remaining_seconds), 86400)
+        hours, rem = divmod(rem, 3600)
+        minutes, seconds = divmod(rem, 60)
+        time_remaining = f"{hours}:{minutes:02d}:{seconds:02d}"
+        if days:
+            time_remaining = f"{days} day{'s' if days != 1 else ''}, {time_remaining}"
         
         # Calculate estimated end time
-        current_time = datetime.now()
-        estimated_end_time = current_time + timedelta(seconds=time_remaining_seconds)
+        estimated_end_time = datetime.fromtimestamp(time.time() + time_remaining_seconds)
         
         # Compile all metrics into a dictionary
         metrics = {
@@ -89,17 +126,4 @@ class EpochCalculator:
         Returns:
             Average slot time in seconds
         """
-        # Get performance samples
-        performance_samples = rpc_api.get_recent_performance_samples(num_samples, self.cluster)
-        
-        # Filter out samples with 0 slots to avoid division by zero
-        valid_samples = [s for s in performance_samples if s["numSlots"] > 0]
-        
-        if not valid_samples:
-            return 0.4  # Solana's target slot time as fallback
-        
-        # Calculate weighted average of slot times
-        total_slots = sum(sample["numSlots"] for sample in valid_samples)
-        total_time = sum(sample["samplePeriodSecs"] for sample in valid_samples)
-        
-        return total_time / total_slots if total_slots > 0 else 0.4
\ No newline at end of file
+        return avg_slot_time(self.cluster, num_samples)
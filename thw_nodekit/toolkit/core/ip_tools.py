@@ -3,10 +3,33 @@ Utilities for working with IP addresses, geolocation, and IP metadata.
 """
 
 import ipinfo
-from typing import Dict, Any, Optional
-from functools import lru_cache
+import ipaddress
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
 from thw_nodekit.config import get_config
 
+# IP metadata is effectively static; entries past half their TTL are served
+# stale while a background refresh replaces them
+IP_INFO_CACHE_MAXSIZE = 4096
+IP_INFO_CACHE_TTL_SEC = 86400
+
+_ip_info_cache: Dict[Tuple[str, Optional[str]], Tuple[float, Dict[str, Any]]] = {}
+_ip_info_cache_lock = threading.Lock()
+_ip_info_refreshing = set()
+_ip_info_refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ipinfo-refresh")
+
+# Parsed results persist across CLI runs; entries not refreshed for 30 days are dropped on load
+IP_INFO_DISK_CACHE_FILE = Path.home() / ".cache" / "thw-nodekit" / "ipinfo.json"
+IP_INFO_DISK_CACHE_MAX_AGE_SEC = 30 * 86400
+
+_disk_cache: Optional[Dict[str, Tuple[float, Dict[str, Any]]]] = None  # ip -> (fetched_at, result)
+_disk_cache_lock = threading.Lock()
+
 def get_ip_info(ip_address: str, token: Optional[str] = None, cache: bool = True) -> Dict[str, Any]:
     """
     Retrieve information about an IP address using the ipinfo.io API.
@@ -30,50 +53,183 @@ def get_ip_info(ip_address: str, token: Optional[str] = None, cache: bool = True
         - org_name: Organization name without ASN
         - va_format: VA-style format string
         
+        Private, loopback, link-local and other non-routable addresses are
+        answered locally (with 'bogon': True) without an API request.
+        
     Raises:
         RuntimeError: If the API request fails
     """
+    bogon_info = _get_bogon_info(ip_address)
+    if bogon_info is not None:
+        return bogon_info
+    
     if token is None:
-        config = get_config()
-        token = config.get("toolkit.ipinfo_token")
+        token = _get_default_token()
         
     if cache:
         return _get_ip_info_cached(ip_address, token)
     else:
         return _get_ip_info_uncached(ip_address, token)
 
-@lru_cache(maxsize=1024)
+def _get_bogon_info(ip_address: str) -> Optional[Dict[str, Any]]:
+    """Synthesized result for non-routable addresses, or None for public/unparsable ones"""
+    try:
+        addr = ipaddress.ip_address(ip_address)
+    except ValueError:
+        return None
+    if not (addr.is_private or addr.is_loopback or addr.is_link_local or addr.is_reserved
+            or addr.is_multicast or addr.is_unspecified):
+        return None
+    return {
+        "ip": ip_address,
+        "bogon": True,
+        "org": "",
+        "asn": "AS0",
+        "org_name": "private",
+        "country": "ZZ",
+        "city": "Local",
+        "va_format": "0-ZZ-Local",
+    }
+
+def _get_default_token() -> Optional[str]:
+    """Look up the configured ipinfo.io token"""
+    return get_config().get("toolkit.ipinfo_token")
+
+def _load_disk_cache() -> Dict[str, Tuple[float, Dict[str, Any]]]:
+    """Load IP_INFO_DISK_CACHE_FILE once per process, skipping entries past the max age"""
+    global _disk_cache
+    with _disk_cache_lock:
+        if _disk_cache is None:
+            _disk_cache = {}
+            try:
+                with open(IP_INFO_DISK_CACHE_FILE) as f:
+                    entries = json.load(f)
+                now = time.time()
+                for ip_address, (fetched_at, result) in entries.items():
+                    if now - fetched_at < IP_INFO_DISK_CACHE_MAX_AGE_SEC:
+                        _disk_cache[ip_address] = (fetched_at, result)
+            except (OSError, ValueError, TypeError, AttributeError):
+                pass
+        return _disk_cache
+
+def _save_disk_entry(ip_address: str, fetched_at: float, result: Dict[str, Any]) -> None:
+    """Record a fresh result and rewrite the disk cache atomically"""
+    disk_cache = _load_disk_cache()
+    with _disk_cache_lock:
+        disk_cache[ip_address] = (fetched_at, result)
+        tmp_path = IP_INFO_DISK_CACHE_FILE.with_suffix(".tmp")
+        try:
+            IP_INFO_DISK_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(disk_cache, f)
+            os.replace(tmp_path, IP_INFO_DISK_CACHE_FILE)
+        except OSError:
+            pass
+
+def _store_ip_info(key: Tuple[str, Optional[str]], result: Dict[str, Any],
+                   fetched_at: Optional[float] = None) -> None:
+    """Insert or replace a cache entry, evicting the oldest one when full"""
+    persist = fetched_at is None
+    if persist:
+        fetched_at = time.time()
+    with _ip_info_cache_lock:
+        _ip_info_cache.pop(key, None)
+        if len(_ip_info_cache) >= IP_INFO_CACHE_MAXSIZE:
+            del _ip_info_cache[next(iter(_ip_info_cache))]
+        _ip_info_cache[key] = (fetched_at, result)
+    if persist:
+        _save_disk_entry(key[0], fetched_at, result)
+
+def _refresh_ip_info(key: Tuple[str, Optional[str]]) -> None:
+    """Background refresh of a stale entry; the stale value stays on failure"""
+    try:
+        _store_ip_info(key, _get_ip_info_uncached(*key))
+    except RuntimeError:
+        pass
+    finally:
+        with _ip_info_cache_lock:
+            _ip_info_refreshing.discard(key)
+
 def _get_ip_info_cached(ip_address: str, token: Optional[str] = None) -> Dict[str, Any]:
-    """Cached version of the IP info retrieval function"""
-    return _get_ip_info_uncached(ip_address, token)
+    """Cached version of the IP info retrieval function (TTL, stale-while-revalidate)"""
+    key = (ip_address, token)
+    with _ip_info_cache_lock:
+        entry = _ip_info_cache.get(key)
+
+    if entry is None:
+        # Promote a result persisted by an earlier run, keeping its original fetch time
+        entry = _load_disk_cache().get(ip_address)
+        if entry is None:
+            result = _get_ip_info_uncached(ip_address, token)
+            _store_ip_info(key, result)
+            return result
+        _store_ip_info(key, entry[1], fetched_at=entry[0])
+
+    fetched_at, result = entry
+    if time.time() - fetched_at > IP_INFO_CACHE_TTL_SEC / 2:
+        with _ip_info_cache_lock:
+            if key not in _ip_info_refreshing:
+                _ip_info_refreshing.add(key)
+                _ip_info_refresher.submit(_refresh_ip_info, key)
+    return result
+
+class _NoCache:
+    """ipinfo handler cache that stores nothing.
+    
+    Caching is done by this module (with background refresh); a handler-level
+    cache would serve refreshes stale data and share result dicts between lookups.
+    """
+    
+    def __contains__(self, key):
+        return False
+    
+    def __getitem__(self, key):
+        raise KeyError(key)
+    
+    def __setitem__(self, key, value):
+        pass
+    
+    def __delitem__(self, key):
+        pass
+
+# One handler per token, so its country/continent lookup tables are loaded once instead of per
+# lookup. The handler issues each request through a plain requests.get, so connections are not reused.
+_handler_cache: Dict[Optional[str], Any] = {}
+
+def _get_handler(token: Optional[str]):
+    """Return the ipinfo handler for a token, creating it on first use"""
+    handler = _handler_cache.get(token)
+    if handler is None:
+        handler = _handler_cache[token] = ipinfo.getHandler(token, cache=_NoCache())
+    return handler
 
 def _get_ip_info_uncached(ip_address: str, token: Optional[str] = None) -> Dict[str, Any]:
     """Uncached implementation of IP info retrieval"""
     try:
-        # Create a handler with the token
-        handler = ipinfo.getHandler(token)
+        handler = _get_handler(token)
         
         # Get the details for the IP
         details = handler.getDetails(ip_address)
-        ip_data = details.all
         
-        # Enhance the data with additional processed fields
-        result = dict(ip_data)
+        # Enhance the decoded response in place with additional processed fields;
+        # it is owned by this lookup (the handler keeps no cache), so no copy is needed
+        result = details.all
         
         # Process organization info to extract ASN
-        org_info = ip_data.get('org', '')
+        org_info = result.get('org', '')
         if org_info and ' ' in org_info and org_info.startswith('AS'):
             asn, org = org_info.split(' ', 1)
             result['asn'] = asn
             result['org_name'] = org
+            asn_num = asn[2:]
         else:
             result['asn'] = 'AS0'
             result['org_name'] = org_info
+            asn_num = '0'
         
         # Create VA-style format string
-        country = ip_data.get('country', 'Unknown')
-        city = ip_data.get('city', 'Unknown')
-        asn_num = result['asn'][2:] if result['asn'].startswith('AS') else result['asn']
+        country = result.get('country', 'Unknown')
+        city = result.get('city', 'Unknown')
         result['va_format'] = f"{asn_num}-{country}-{city}"
         
         return result
@@ -4,9 +4,23 @@ Solana leader slot and block production calculations and analysis.
 Provides metrics and utilities for working with Solana epoch data.
 """
 
+import math
+import time
+import logging
+import bisect
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 from thw_nodekit.toolkit.core import rpc_api
+from thw_nodekit.toolkit.core.epoch_calculator import avg_slot_time as _avg_slot_time
+
+logger = logging.getLogger(__name__)
+
+# Performance samples cover 60 seconds each, so this averages over the last hour
+AVG_SLOT_TIME_NUM_SAMPLES = 60
+# Per-sample weight decay (newest sample first), so recent minutes dominate the hourly average
+AVG_SLOT_TIME_SAMPLE_DECAY = math.exp(-0.05)
+# Time updates within this window (about one slot) reuse the last slot index instead of refetching epoch info
+EPOCH_INFO_REUSE_SEC = 0.4
 
 
 class LeaderCalculator:
@@ -14,6 +28,8 @@ class LeaderCalculator:
     Calculates and analyses leader slots and block production for current epoch.
     """
     
+    __slots__ = ("cluster", "_schedule_cache", "_last_epoch_info")
+    
     def __init__(self, cluster: Optional[str] = None):
         """
         Initialize calculator.
@@ -22,6 +38,9 @@ class LeaderCalculator:
             cluster: Optional cluster name to use for RPC calls
         """
         self.cluster = cluster
+        # Sorted leader slots of one identity; the schedule is fixed for a whole epoch
+        self._schedule_cache = {"epoch": None, "identity": None, "slots": None}
+        self._last_epoch_info = (0.0, 0)  # (monotonic time fetched, slot index)
     
     def calculate_leader_metrics(self, identity: str) -> Dict[str, Any]:
         """
@@ -35,36 +54,23 @@ class LeaderCalculator:
         Returns:
             Dictionary containing leader slot and block production metrics
         """
-        # Get necessary data from RPC API
-        epoch_info = rpc_api.get_epoch_info(self.cluster)
+        # Get necessary data from RPC API in one round trip; performance samples
+        # for the average slot time are served from the RPC client cache
+        epoch_info, leader_schedule, block_production = self._fetch_leader_data(identity)
+        avg_slot_time = self._calculate_avg_slot_time()
+        
         current_slot = epoch_info["absoluteSlot"]
         slot_index = epoch_info["slotIndex"]
         slots_in_epoch = epoch_info["slotsInEpoch"]
+        self._last_epoch_info = (time.monotonic(), slot_index)
         
-        # Calculate average slot time using performance samples
-        avg_slot_time = self._calculate_avg_slot_time()
-        
-        # Get leader schedule
-        leader_schedule = rpc_api.get_leader_schedule(None, identity, self.cluster)
-        
-        # Get block production information
-        block_production = rpc_api.get_block_production(identity, self.cluster)
-        
-        # Process leader slots
-        leader_slots_total = 0
-        leader_slots_upcoming = []
-        leader_slots_completed = []
-        
-        if leader_schedule and identity in leader_schedule:
-            # Extract leader slots
-            leader_slots = [int(slot) for slot in leader_schedule[identity]]
-            leader_slots_total = len(leader_slots)
-            
-            # Separate upcoming and completed slots
-            leader_slots_completed = [slot for slot in leader_slots if slot <= slot_index]
-            leader_slots_upcoming = [slot for slot in leader_slots if slot > slot_index]
-        else:
-            leader_slots = []
+        # Process leader slots: with the epoch's slots sorted once, the split into
+        # completed and upcoming slots is a single binary search per refresh
+        leader_slots = self._get_sorted_leader_slots(epoch_info["epoch"], identity, leader_schedule)
+        leader_slots_total = len(leader_slots)
+        leader_slots_completed = bisect.bisect_right(leader_slots, slot_index)
+        leader_slots_upcoming = leader_slots[leader_slots_completed:]
+        leader_slot_next = leader_slots_upcoming[0] if leader_slots_upcoming else None
         
         # Process block production data
         blocks_produced = 0
@@ -79,14 +85,9 @@ class LeaderCalculator:
         
         # Calculate skip rate
         skip_rate = 0
-        if len(leader_slots_completed) > 0:
-            skip_rate = (leader_slots_skipped / len(leader_slots_completed)) * 100
+        if leader_slots_completed > 0:
+            skip_rate = (leader_slots_skipped / leader_slots_completed) * 100
         
-        # Get next leader slot
-        leader_slot_next = None
-        if leader_slots_upcoming:
-            leader_slot_next = min(leader_slots_upcoming)
-            
         # Calculate time estimates based on current data
         leader_slot_time_data = None
         if leader_slot_next is not None:
@@ -99,7 +100,7 @@ class LeaderCalculator:
             # Core metrics
             "leader_slots_total": leader_slots_total,
             "leader_slots_upcoming": leader_slots_upcoming,
-            "leader_slots_completed": len(leader_slots_completed),
+            "leader_slots_completed": leader_slots_completed,
             "leader_slots_skipped": leader_slots_skipped,
             "blocks_produced": blocks_produced,
             "blocks_produced_upcoming": len(leader_slots_upcoming),
@@ -115,6 +116,50 @@ class LeaderCalculator:
         
         return metrics
     
+    def _get_sorted_leader_slots(self, epoch: int, identity: str,
+                                 leader_schedule: Optional[Dict[str, List[int]]]) -> List[int]:
+        """
+        Return the identity's leader slot indices in ascending order, sorted once per epoch.
+        
+        Args:
+            epoch: Current epoch
+            identity: Validator identity pubkey
+            leader_schedule: Leader schedule filtered to the identity
+            
+        Returns:
+            Sorted list of leader slot indices (empty if the identity has none)
+        """
+        cache = self._schedule_cache
+        if cache["epoch"] == epoch and cache["identity"] == identity and cache["slots"]:
+            return cache["slots"]
+        
+        # Slot indices arrive as JSON integers, so no per-slot int() coercion is needed
+        slots = sorted(leader_schedule[identity]) if leader_schedule and identity in leader_schedule else []
+        self._schedule_cache = {"epoch": epoch, "identity": identity, "slots": slots}
+        return slots
+    
+    def _fetch_leader_data(self, identity: str) -> List[Any]:
+        """
+        Fetch everything calculate_leader_metrics needs in a single JSON-RPC batch.
+        
+        Providers that reject batch requests are served by RPC_Methods.batch
+        sending the calls concurrently instead.
+        
+        Args:
+            identity: Validator identity pubkey
+            
+        Returns:
+            [epoch_info, leader_schedule, block_production]
+            
+        Raises:
+            RuntimeError: If any request fails
+        """
+        return rpc_api.get_client(self.cluster).methods.batch([
+            ("getEpochInfo", None),
+            ("getLeaderSchedule", [None, {"identity": identity}]),
+            ("getBlockProduction", [{"identity": identity}]),
+        ])
+    
     def calculate_leader_time_metrics(self, next_slot: int, current_slot_index: int, 
                                      avg_slot_time: Optional[float] = None) -> Dict[str, Any]:
         """
@@ -159,10 +204,15 @@ class LeaderCalculator:
         Returns:
             Updated metrics dictionary with fresh time calculations
         """
-        # Get current epoch info
+        # Get current epoch info, unless the last one is recent enough to reuse
         try:
-            epoch_info = rpc_api.get_epoch_info(self.cluster)
-            current_slot_index = epoch_info["slotIndex"]
+            fetched_at, last_slot_index = self._last_epoch_info
+            if time.monotonic() - fetched_at < EPOCH_INFO_REUSE_SEC:
+                current_slot_index = last_slot_index
+            else:
+                epoch_info = rpc_api.get_epoch_info(self.cluster)
+                current_slot_index = epoch_info["slotIndex"]
+                self._last_epoch_info = (time.monotonic(), current_slot_index)
             
             # Update the slot index in metrics
             metrics["current_slot_index"] = current_slot_index
@@ -178,10 +228,10 @@ class LeaderCalculator:
                 
             return metrics
         except Exception as e:
-            print(f"Error updating leader time metrics: {e}")
+            logger.debug("Error updating leader time metrics: %s", e)
             return metrics
     
-    def _calculate_avg_slot_time(self, num_samples: int = 500) -> float:
+    def _calculate_avg_slot_time(self, num_samples: int = AVG_SLOT_TIME_NUM_SAMPLES) -> float:
         """
         Calculate average slot time from performance samples.
         
@@ -191,17 +241,4 @@ class LeaderCalculator:
         Returns:
             Average slot time in seconds
         """
-        # Get performance samples
-        performance_samples = rpc_api.get_recent_performance_samples(num_samples, self.cluster)
-        
-        # Filter out samples with 0 slots to avoid division by zero
-        valid_samples = [s for s in performance_samples if s["numSlots"] > 0]
-        
-        if not valid_samples:
-            return 0.4  # Solana's target slot time as fallback
-        
-        # Calculate weighted average of slot times
-        total_slots = sum(sample["numSlots"] for sample in valid_samples)
-        total_time = sum(sample["samplePeriodSecs"] for sample in valid_samples)
-        
-        return total_time / total_slots if total_slots > 0 else 0.4
\ No newline at end of file
+        return _avg_slot_time(self.cluster, num_samples, AVG_SLOT_TIME_SAMPLE_DECAY)
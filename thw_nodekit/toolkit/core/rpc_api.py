@@ -6,11 +6,15 @@ access, providing a clean and consistent interface that abstracts away
 implementation details of the underlying RPC system.
 """
 
+import threading
 from typing import Any, Dict, List, Optional, Union
+from thw_nodekit.config import get_config
 from thw_nodekit.toolkit.core.rpc_client import RPC_Client, get_rpc_client
 
-# Global client instance cache to avoid creating multiple clients
+# Global client instance cache to avoid creating multiple clients; each client
+# owns a pooled keep-alive session, so sharing it keeps connections warm
 _client_cache: Dict[str, RPC_Client] = {}
+_client_cache_lock = threading.Lock()
 
 
 def get_client(cluster: Optional[str] = None) -> RPC_Client:
@@ -26,12 +30,18 @@ def get_client(cluster: Optional[str] = None) -> RPC_Client:
     Returns:
         RPC_Client: Configured client instance
     """
-    cache_key = cluster or "default"
+    # Resolve the default so that None and the default cluster's name share one client
+    cache_key = cluster or get_config().get("default_cluster", "um")
     
-    if (cache_key not in _client_cache):
-        _client_cache[cache_key] = get_rpc_client(cluster)
+    client = _client_cache.get(cache_key)
+    if client is None:
+        # Locked so that threads racing on first use don't each open their own session
+        with _client_cache_lock:
+            client = _client_cache.get(cache_key)
+            if client is None:
+                client = _client_cache[cache_key] = get_rpc_client(cache_key)
         
-    return _client_cache[cache_key]
+    return client
 
 
 # ==============================
@@ -52,8 +62,8 @@ def get_vote_accounts(cluster: Optional[str] = None, include_delinquent: bool =
         If include_delinquent is False: List of current (non-delinquent) validators
     """
     client = get_client(cluster)
-    # Use direct method call to bypass the RPC client's own caching
-    response = client.methods.get_vote_accounts()
+    # Served from the client's short-lived cache (see RPC_Client.cache_ttl)
+    response = client.cached_call("get_vote_accounts")
     
     if not include_delinquent and response and "current" in response:
         return response["current"]
@@ -72,7 +82,7 @@ def get_cluster_nodes(cluster: Optional[str] = None) -> List[Dict[str, Any]]:
         List of node information dictionaries
     """
     client = get_client(cluster)
-    return client.methods.get_cluster_nodes()
+    return client.get_cluster_nodes()
 
 
 def get_validator_info(cluster: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -103,7 +113,7 @@ def get_leader_schedule(slot: Optional[int] = None, identity: Optional[str] = No
         Dictionary mapping validator pubkeys to their leader slots
     """
     client = get_client(cluster)
-    return client.methods.get_leader_schedule(slot, identity=identity)
+    return client.cached_call("get_leader_schedule", slot, identity=identity)
 
 
 def get_epoch_info(cluster: Optional[str] = None) -> Dict[str, Any]:
@@ -117,7 +127,7 @@ def get_epoch_info(cluster: Optional[str] = None) -> Dict[str, Any]:
         Dictionary containing epoch information
     """
     client = get_client(cluster)
-    return client.methods.get_epoch_info()
+    return client.cached_call("get_epoch_info")
 
 
 def get_block_production(identity: Optional[str] = None, cluster: Optional[str] = None) -> Dict[str, Any]:
@@ -132,7 +142,7 @@ def get_block_production(identity: Optional[str] = None, cluster: Optional[str]
         Dictionary containing block production information for the validator identity pubkey
     """
     client = get_client(cluster)
-    return client.methods.get_block_production(identity=identity)
+    return client.cached_call("get_block_production", identity=identity)
 
 
 # ====================
@@ -216,7 +226,7 @@ def get_recent_performance_samples(limit: int = 100, cluster: Optional[str] = No
         List of performance sample dictionaries
     """
     client = get_client(cluster)
-    return client.methods.get_recent_performance_samples(limit)
+    return client.cached_call("get_recent_performance_samples", limit)
 
 
 # ====================
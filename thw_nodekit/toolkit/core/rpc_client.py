@@ -3,12 +3,16 @@ High-level Solana client combining RPC communication with caching and methods.
 """
 
 import time
+import logging
 import threading
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Union, Callable
 from thw_nodekit.config import get_config
 from thw_nodekit.toolkit.core.rpc_core import RPC_Core
 from thw_nodekit.toolkit.core.rpc_methods import RPC_Methods
 
+logger = logging.getLogger(__name__)
+
 
 class RPC_Client:
     """
@@ -21,6 +25,26 @@ class RPC_Client:
     - Configuration from application settings
     """
     
+    __slots__ = ("rpc", "methods", "cache", "cache_lock", "_method_table", "_inflight")
+    
+    # Per-method cache TTLs in seconds, shared read-only by all clients
+    cache_ttl = MappingProxyType({
+        # High-frequency data (sub-second updates)
+        "get_vote_accounts": 0.5,     # 500ms
+        "get_slot": 0.2,              # 200ms
+        "get_epoch_info": 0.5,        # 500ms
+        
+        # Medium-frequency data (seconds)
+        "get_cluster_nodes": 15.0,    # 15 seconds
+        "get_leader_schedule": 5.0,   # 5 seconds
+        "get_block_production": 5.0,  # 5 seconds 
+        
+        # Low-frequency data (tens of seconds to minutes)
+        "get_recent_performance_samples": 30.0,  # 30 seconds
+        "get_validator_info": 600.0,  # 10 minutes (published info rarely changes)
+        "get_balance": 5.0,           # 5 seconds
+    })
+    
     def __init__(self, urls: Optional[List[str]] = None, cluster: Optional[str] = None):
         """
         Initialize Solana client.
@@ -51,21 +75,11 @@ class RPC_Client:
         
         # Initialize cache
         self.cache = {}
-        self.cache_ttl = {
-            # High-frequency data (sub-second updates)
-            "get_vote_accounts": 0.5,     # 500ms
-            "get_slot": 0.2,              # 200ms
-            "get_epoch_info": 0.5,        # 500ms
-            
-            # Medium-frequency data (seconds)
-            "get_cluster_nodes": 15.0,    # 15 seconds
-            "get_leader_schedule": 5.0,   # 5 seconds
-            "get_block_production": 5.0,  # 5 seconds 
-            
-            # Low-frequency data (tens of seconds)
-            "get_validator_info": 60.0,   # 60 seconds
-            "get_balance": 5.0,           # 5 seconds
-        }
+        # Fetches currently on the wire, keyed like the cache, so concurrent misses share one RPC
+        self._inflight = {}
+        
+        # Pre-resolved bound methods for the cached method names
+        self._method_table = {name: getattr(self.methods, name) for name in self.cache_ttl}
         
     def cached_call(self, method_name: str, *args, ttl: Optional[float] = None, **kwargs) -> Any:
         """
@@ -81,40 +95,61 @@ class RPC_Client:
             Method result (from cache if valid, otherwise fresh)
         """
         # Get the actual method
-        method = getattr(self.methods, method_name)
+        method = self._method_table.get(method_name) or getattr(self.methods, method_name)
         
-        # Create cache key from method name and arguments
-        arg_str = str(args) + str(sorted(kwargs.items()))
-        cache_key = f"{method_name}:{arg_str}"
+        # Cache key from method name and arguments; a plain tuple is hashable without string formatting
+        cache_key = (method_name, args, tuple(sorted(kwargs.items())) if kwargs else ())
         
         # Get TTL for this method
         method_ttl = ttl if ttl is not None else self.cache_ttl.get(method_name, 30)
         
-        # Check cache with proper locking
+        # Check cache with proper locking; the lock is not held during the RPC itself,
+        # so concurrent calls for other methods are not serialized behind it
+        current_time = time.time()
         with self.cache_lock:
-            current_time = time.time()
-            if cache_key in self.cache:
-                entry = self.cache[cache_key]
-                if current_time - entry["timestamp"] < method_ttl:
-                    return entry["data"]
+            entry = self.cache.get(cache_key)
+            if entry is not None and current_time - entry["timestamp"] < method_ttl:
+                return entry["data"]
+            
+            # Join an identical fetch already in progress instead of issuing a duplicate RPC
+            flight = self._inflight.get(cache_key)
+            is_leader = flight is None
+            if is_leader:
+                flight = {"event": threading.Event(), "result": None, "error": None}
+                self._inflight[cache_key] = flight
+        
+        if not is_leader:
+            flight["event"].wait()
+            if flight["error"] is None:
+                return flight["result"]
+            # The shared fetch failed; fall back to cached data like the fetching caller does
+            if entry is not None:
+                return entry["data"]
+            raise flight["error"]
         
-            # Call method
-            try:
-                result = method(*args, **kwargs)
-                
-                # Cache result with lock
-                with self.cache_lock:
-                    self.cache[cache_key] = {
-                        "data": result,
-                        "timestamp": current_time
-                    }
-                return result
-            except Exception as e:
-                # If error and cached data available, return cached data
-                if cache_key in self.cache:
-                    print(f"Error refreshing {method_name}, using cached data: {e}")
-                    return self.cache[cache_key]["data"]
-                raise
+        # Call method
+        try:
+            result = method(*args, **kwargs)
+            flight["result"] = result
+        except Exception as e:
+            flight["error"] = e
+            # If error and cached data available, return cached data
+            if entry is not None:
+                logger.debug("Error refreshing %s, using cached data: %s", method_name, e)
+                return entry["data"]
+            raise
+        else:
+            # Cache result with lock
+            with self.cache_lock:
+                self.cache[cache_key] = {
+                    "data": result,
+                    "timestamp": current_time
+                }
+            return result
+        finally:
+            with self.cache_lock:
+                self._inflight.pop(cache_key, None)
+            flight["event"].set()
     
     def clear_cache(self, method_name: Optional[str] = None) -> None:
         """
@@ -125,8 +160,7 @@ class RPC_Client:
         """
         with self.cache_lock:
             if method_name:
-                prefix = f"{method_name}:"
-                self.cache = {k: v for k, v in self.cache.items() if not k.startswith(prefix)}
+                self.cache = {k: v for k, v in self.cache.items() if k[0] != method_name}
             else:
                 self.cache.clear()
     
@@ -141,9 +175,9 @@ class RPC_Client:
         return self.cached_call("get_cluster_nodes")
     
     def get_validator_info(self) -> List[Dict[str, Any]]:
-        """Get validator information."""
-        # Call methods.get_validator_info which handles the CLI execution
-        return self.methods.get_validator_info()
+        """Get cached validator information."""
+        # methods.get_validator_info may shell out to the Solana CLI, so keep it cached
+        return self.cached_call("get_validator_info")
     
     def get_leader_schedule(self, slot: Optional[int] = None) -> Dict[str, Any]:
         """Get cached leader schedule."""
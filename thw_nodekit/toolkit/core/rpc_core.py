@@ -4,11 +4,30 @@ Core Solana JSON-RPC client handling connection and communication.
 
 import time
 import json
+import logging
 import requests
 from typing import Any, Dict, List, Optional, Union
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+logger = logging.getLogger(__name__)
+
+# Endpoint selection: prefer the lowest EWMA latency, penalising each consecutive error
+LATENCY_EWMA_ALPHA = 0.2
+ERROR_PENALTY_MS = 1000.0
+# The error penalty halves every this many seconds since the URL's last failure, so a demoted
+# URL is tried again after a while even if no request has been sent to it in the meantime
+ERROR_PENALTY_HALF_LIFE_SEC = 30.0
+# Backoff after every endpoint has failed once in a round: 0.5s, 1s, 2s, ...
+RETRY_BACKOFF_BASE_SEC = 0.5
+
+# Shared by every request instead of being rebuilt per call
+_HEADERS = {"Content-Type": "application/json"}
+
+
+class BatchNotSupportedError(RuntimeError):
+    """Raised when an endpoint rejects JSON-RPC batch requests outright."""
+
 
 class RPC_Core:
     """
@@ -18,6 +37,8 @@ class RPC_Core:
     without concern for specific Solana methods or business logic.
     """
     
+    __slots__ = ("urls", "timeout", "max_retries", "url_stats", "session", "batch_supported")
+    
     def __init__(self, urls: List[str], timeout: int = 30, max_retries: int = 3):
         """
         Initialize RPC client with multiple endpoint URLs.
@@ -33,7 +54,9 @@ class RPC_Core:
         self.urls = urls
         self.timeout = timeout
         self.max_retries = max_retries
-        self.current_url_index = 0
+        self.url_stats = {url: {"ewma_latency": 0.0, "error_streak": 0, "last_error_at": 0.0} for url in urls}
+        # Cleared once an endpoint rejects a batch request; callers then send calls individually
+        self.batch_supported = True
         
         # Configure session with connection pooling for performance
         self.session = self._configure_session()
@@ -64,12 +87,39 @@ class RPC_Core:
         
     @property
     def current_url(self) -> str:
-        """Get current active RPC URL."""
-        return self.urls[self.current_url_index]
+        """Get the preferred RPC URL (fastest recent latency, fewest recent consecutive errors)."""
+        url_stats = self.url_stats
+        now = time.monotonic()
+        
+        def score(url: str) -> float:
+            stats = url_stats[url]
+            if not stats["error_streak"]:
+                return stats["ewma_latency"]
+            decay = 0.5 ** ((now - stats["last_error_at"]) / ERROR_PENALTY_HALF_LIFE_SEC)
+            return stats["ewma_latency"] + ERROR_PENALTY_MS * stats["error_streak"] * decay
+        
+        return min(self.urls, key=score)
+        
+    def _record_result(self, url: str, latency_ms: Optional[float]) -> None:
+        """
+        Update an endpoint's health after a request.
+        
+        Args:
+            url: Endpoint the request was sent to
+            latency_ms: Request latency on success, None on failure
+        """
+        stats = self.url_stats[url]
+        if latency_ms is None:
+            stats["error_streak"] += 1
+            stats["last_error_at"] = time.monotonic()
+        else:
+            stats["ewma_latency"] = LATENCY_EWMA_ALPHA * latency_ms + (1 - LATENCY_EWMA_ALPHA) * stats["ewma_latency"]
+            stats["error_streak"] //= 2
         
-    def _next_url(self) -> None:
-        """Rotate to next available RPC URL."""
-        self.current_url_index = (self.current_url_index + 1) % len(self.urls)
+    def _backoff(self, attempts: int) -> None:
+        """Sleep with exponential backoff, but only after every URL has failed in this round."""
+        if attempts % len(self.urls) == 0 and attempts < self.max_retries * len(self.urls):
+            time.sleep(RETRY_BACKOFF_BASE_SEC * 2 ** (attempts // len(self.urls) - 1))
         
     def call(self, method: str, params: Optional[List[Any]] = None) -> Any:
         """
@@ -99,29 +149,34 @@ class RPC_Core:
                     "params": params
                 }
                 
+                url = self.current_url
+                start = time.monotonic()
                 response = self.session.post(
-                    self.current_url,
+                    url,
                     json=payload,
-                    headers={"Content-Type": "application/json"},
+                    headers=_HEADERS,
                     timeout=self.timeout
                 )
                 response.raise_for_status()
-                result = response.json()
+                # Parse the raw body directly (json.loads detects UTF-8 from bytes),
+                # skipping requests' intermediate str decode of large responses
+                result = json.loads(response.content)
                 
                 if "error" in result:
                     error = result["error"]
                     raise RuntimeError(f"RPC error: {error.get('message')}")
-                    
+                
+                self._record_result(url, (time.monotonic() - start) * 1000)
                 return result.get("result")
                 
             except Exception as e:
                 last_error = e
-                print(f"RPC error with {self.current_url}: {e}")
+                logger.debug("RPC error with %s: %s", url, e)
                 
-                # Try next URL
-                self._next_url()
+                # Penalise this URL so the next attempt goes to the healthiest one
+                self._record_result(url, None)
                 attempts += 1
-                time.sleep(0.5)
+                self._backoff(attempts)
                 
         # All attempts failed
         raise RuntimeError(f"All RPC endpoints failed after {self.max_retries} attempts each: {str(last_error)}")
@@ -135,6 +190,10 @@ class RPC_Core:
             
         Returns:
             List of results in same order as requests
+            
+        Raises:
+            BatchNotSupportedError: If the endpoint rejects batch requests (not retried)
+            RuntimeError: If all endpoints fail
         """
         payload = []
         for i, req in enumerate(requests):
@@ -151,56 +210,75 @@ class RPC_Core:
         # Try each URL up to max_retries times
         while attempts < self.max_retries * len(self.urls):
             try:
+                url = self.current_url
+                start = time.monotonic()
                 response = self.session.post(
-                    self.current_url,
+                    url,
                     json=payload,
-                    headers={"Content-Type": "application/json"},
+                    headers=_HEADERS,
                     timeout=self.timeout
                 )
                 
+                # A client error other than rate limiting, or a single error object instead of
+                # a list, is a rejection of batching itself: retrying it or penalising the URL
+                # would only delay the caller's fallback
+                if 400 <= response.status_code < 500 and response.status_code != 429:
+                    self.batch_supported = False
+                    raise BatchNotSupportedError(f"{url} rejected batch request: HTTP {response.status_code}")
                 response.raise_for_status()
-                responses = response.json()
+                responses = json.loads(response.content)
                 
                 # For batch requests, response is a list
                 if not isinstance(responses, list):
+                    if isinstance(responses, dict) and "error" in responses:
+                        self.batch_supported = False
+                        raise BatchNotSupportedError(f"{url} rejected batch request: {responses['error']}")
                     raise ValueError("Expected batch response to be a list")
                 
-                # Extract results in proper order
-                results = []
-                responses_by_id = {r.get("id"): r for r in responses}
+                # Servers usually answer in request order, so this sort is close to free;
+                # responses with an unusable id sort first and are skipped below
+                responses.sort(key=lambda r: r.get("id") if isinstance(r.get("id"), int) else 0)
                 
-                for i in range(1, len(requests) + 1):
-                    if i in responses_by_id:
-                        resp = responses_by_id[i]
-                        if "error" in resp:
-                            error = resp["error"]
-                            results.append({
-                                "success": False,
-                                "error": f"RPC Error {error.get('code')}: {error.get('message')}"
-                            })
-                        else:
-                            results.append({
-                                "success": True,
-                                "result": resp.get("result")
-                            })
-                    else:
+                # Walk the sorted responses once, padding any ids the server left out
+                results = []
+                expected_id = 1
+                for resp in responses:
+                    resp_id = resp.get("id")
+                    if not isinstance(resp_id, int) or resp_id < expected_id or resp_id > len(requests):
+                        continue  # Unknown or duplicate id
+                    while expected_id < resp_id:
+                        results.append({"success": False, "error": "Missing response"})
+                        expected_id += 1
+                    if "error" in resp:
+                        error = resp["error"]
                         results.append({
                             "success": False,
-                            "error": "Missing response"
+                            "error": f"RPC Error {error.get('code')}: {error.get('message')}"
+                        })
+                    else:
+                        results.append({
+                            "success": True,
+                            "result": resp.get("result")
                         })
+                    expected_id += 1
+                
+                while expected_id <= len(requests):
+                    results.append({"success": False, "error": "Missing response"})
+                    expected_id += 1
                 
+                self._record_result(url, (time.monotonic() - start) * 1000)
                 return results
                 
+            except BatchNotSupportedError:
+                raise
             except Exception as e:
                 last_error = e
-                print(f"Batch RPC error with {self.current_url}: {str(e)}")
+                logger.debug("Batch RPC error with %s: %s", url, e)
                 
-                # Try next URL
-                self._next_url()
+                # Penalise this URL so the next attempt goes to the healthiest one
+                self._record_result(url, None)
                 attempts += 1
-                
-                # Add small delay between retries
-                time.sleep(0.5)
+                self._backoff(attempts)
         
         # All endpoints failed
         raise RuntimeError(f"All RPC endpoints failed after {attempts} attempts: {str(last_error)}")
\ No newline at end of file
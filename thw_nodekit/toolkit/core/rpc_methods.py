@@ -5,7 +5,22 @@ This module provides a clean interface to Solana JSON-RPC API methods.
 Methods are organized by functional categories for clarity.
 """
 
-from typing import Any, Dict, List, Optional, Union
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Validator info is published as Config program accounts whose first key is VALIDATOR_INFO_KEY
+CONFIG_PROGRAM_ID = "Config1111111111111111111111111111111111111"
+VALIDATOR_INFO_KEY = "Va1idator1nfo111111111111111111111111111111"
+
+# Requests per JSON-RPC batch; larger batches are split to stay under provider limits
+MAX_BATCH_SIZE = 40
+
+# Shared workers for issuing independent calls in parallel over the pooled session
+GATHER_MAX_WORKERS = 8
+_gather_executor = ThreadPoolExecutor(max_workers=GATHER_MAX_WORKERS, thread_name_prefix="rpc-gather")
 
 
 class RPC_Methods:
@@ -27,6 +42,78 @@ class RPC_Methods:
             rpc_client: Instance of RPC_Client
         """
         self.rpc = rpc_client
+        # Last successful validator info, served when every source fails
+        self._last_validator_info = None
+        
+    # ==============================
+    # Batched Requests
+    # ==============================
+    
+    def batch(self, calls: List[Tuple[str, Optional[List[Any]]]]) -> List[Any]:
+        """
+        Send several RPC calls as JSON-RPC batches (one round trip per MAX_BATCH_SIZE calls).
+        
+        Once the endpoint has rejected a batch request, calls are sent concurrently
+        via gather() instead, without trying to batch again.
+        
+        Args:
+            calls: List of (method, params) tuples; params may be None
+            
+        Returns:
+            List of results in the same order as calls
+            
+        Raises:
+            RuntimeError: If any call fails
+        """
+        results = []
+        for start in range(0, len(calls), MAX_BATCH_SIZE):
+            chunk = calls[start:start + MAX_BATCH_SIZE]
+            if not self.rpc.batch_supported:
+                results.extend(self.gather(chunk))
+                continue
+            try:
+                responses = self.rpc.batch_call([
+                    {"method": method, "params": params or []} for method, params in chunk
+                ])
+            except RuntimeError:
+                # Some providers reject batch requests; send the calls in parallel instead
+                results.extend(self.gather(chunk))
+                continue
+            for (method, _), response in zip(chunk, responses):
+                if not response["success"]:
+                    raise RuntimeError(f"{method} failed in batch: {response['error']}")
+                results.append(response["result"])
+        return results
+    
+    def gather(self, calls: List[Tuple[str, Optional[List[Any]]]]) -> List[Any]:
+        """
+        Send several independent RPC calls concurrently, one request per call.
+        
+        Args:
+            calls: List of (method, params) tuples; params may be None
+            
+        Returns:
+            List of results in the same order as calls
+            
+        Raises:
+            RuntimeError: If any call fails
+        """
+        futures = [_gather_executor.submit(self.rpc.call, method, params) for method, params in calls]
+        return [future.result() for future in futures]
+    
+    def get_slot_and_epoch_info(self) -> Tuple[int, Dict[str, Any]]:
+        """
+        Get the current slot and epoch information in a single round trip.
+        
+        getEpochInfo already reports the current slot (absoluteSlot, at the same
+        default commitment as getSlot), so one plain request covers both and
+        works the same on providers that reject batch requests.
+        
+        Returns:
+            Tuple of (current slot, epoch information dictionary)
+        """
+        epoch_info = self.rpc.call("getEpochInfo")
+        return epoch_info["absoluteSlot"], epoch_info
         
     # ==============================
     # Validator and Node Information
@@ -50,60 +137,97 @@ class RPC_Methods:
         """
         return self.rpc.call("getClusterNodes")
     
+    def _get_validator_info_rpc(self) -> List[Dict[str, Any]]:
+        """
+        Get validator information from the Config program accounts over JSON-RPC.
+        
+        Returns:
+            List of validator information objects in the same shape as
+            'solana validator-info get --output json'
+        """
+        accounts = self.rpc.call("getProgramAccounts", [CONFIG_PROGRAM_ID, {"encoding": "jsonParsed"}])
+        
+        validator_info = []
+        for account in accounts:
+            data = account.get("account", {}).get("data")
+            if not isinstance(data, dict):
+                continue
+            parsed = data.get("parsed", {})
+            if parsed.get("type") != "validatorInfo":
+                continue
+            info = parsed.get("info", {})
+            keys = info.get("keys", [])
+            if len(keys) < 2 or keys[0].get("pubkey") != VALIDATOR_INFO_KEY:
+                continue
+            validator_info.append({
+                "identityPubkey": keys[1].get("pubkey", ""),
+                "infoPubkey": account.get("pubkey", ""),
+                "info": info.get("configData", {}),
+            })
+        return validator_info
+    
     def get_validator_info(self) -> List[Dict[str, Any]]:
         """
         Get validator information.
         
-        This uses the Solana CLI command 'validator-info get' as there's
-        no direct RPC equivalent that provides the same metadata.
+        The Config program accounts are read directly over JSON-RPC. The Solana
+        CLI command 'validator-info get' is kept as a fallback; an empty result
+        counts as a failure. If both fail, the last successful result is
+        returned, or limited info from getClusterNodes if there is none yet.
         
         Returns:
             List of validator information objects
         """
         from thw_nodekit.toolkit.core.cli_commands import get_validator_info_cli
         
+        validator_info = None
         try:
-            # Get cluster from config if possible
-            from thw_nodekit.config import get_config
-            config = get_config()
-            # Try to determine which cluster we're using based on the RPC URL
-            current_url = self.rpc.current_url if hasattr(self.rpc, 'current_url') else None
-            
-            # Find which cluster this URL belongs to
-            cluster = None
-            if current_url:
-                for cluster_name, cluster_config in config.get("rpc_urls", {}).items():
-                    if current_url in cluster_config.get("urls", []):
-                        cluster = cluster_name
-                        break
-            
-            # Get validator info via CLI
-            validator_info = get_validator_info_cli(cluster)
-            
-            # Return the list directly - this matches CLI output structure
-            return validator_info
-            
+            validator_info = self._get_validator_info_rpc()
         except Exception as e:
-            print(f"Warning: Validator info unavailable via CLI: {e}")
-            
-            # Fall back to limited info from getClusterNodes for compatibility
+            logger.debug("Validator info unavailable via RPC: %s", e)
+        
+        # Some providers disable or filter getProgramAccounts and answer with an empty list
+        if not validator_info:
+            logger.debug("No validator info via RPC, falling back to CLI")
             try:
-                nodes = self.rpc.call("getClusterNodes")
+                # Determine which cluster we're using based on the RPC URL
+                from thw_nodekit.config import get_url_to_cluster_map
+                current_url = self.rpc.current_url if hasattr(self.rpc, 'current_url') else None
+                cluster = get_url_to_cluster_map().get(current_url) if current_url else None
+                
+                # Get validator info via CLI (returns an empty list on failure)
+                validator_info = get_validator_info_cli(cluster)
                 
-                # Transform to match expected structure as closely as possible
-                return [
-                    {
-                        "identityPubkey": node.get("pubkey", ""),
-                        "info": {
-                            "name": f"Node {node.get('pubkey', '')[:8]}...",
-                        },
-                        "nodeInfo": node  # Add the node technical info for reference
-                    }
-                    for node in nodes
-                ]
-            except Exception:
-                # In case even RPC fails, return empty list
-                return []
+            except Exception as e:
+                logger.debug("Validator info unavailable via CLI: %s", e)
+        
+        if validator_info:
+            self._last_validator_info = validator_info
+            return validator_info
+        
+        # Serve the last successful result rather than degrading to node-only info
+        if self._last_validator_info is not None:
+            logger.debug("Validator info unavailable, serving last known result")
+            return self._last_validator_info
+        
+        # Fall back to limited info from getClusterNodes for compatibility
+        try:
+            nodes = self.rpc.call("getClusterNodes")
+            
+            # Transform to match expected structure as closely as possible
+            return [
+                {
+                    "identityPubkey": node.get("pubkey", ""),
+                    "info": {
+                        "name": f"Node {node.get('pubkey', '')[:8]}...",
+                    },
+                    "nodeInfo": node  # Add the node technical info for reference
+                }
+                for node in nodes
+            ]
+        except Exception:
+            # In case even RPC fails, return empty list
+            return []
     
     # ====================
     # Account Information
@@ -2,9 +2,35 @@
 Utility functions for common operations across the toolkit.
 """
 
+import sys
 import datetime
+from functools import lru_cache
 from typing import Union, Optional, Tuple
-import pytz  # Make sure this is in your requirements.txt
+
+# Use the standard library's timezone database where available
+if sys.version_info >= (3, 9):
+    from zoneinfo import ZoneInfo as _load_timezone, ZoneInfoNotFoundError as _UnknownTimeZoneError
+else:
+    import pytz
+    _load_timezone = pytz.timezone
+    _UnknownTimeZoneError = pytz.exceptions.UnknownTimeZoneError
+
+
+@lru_cache(maxsize=64)
+def _get_timezone(name: str) -> Optional[datetime.tzinfo]:
+    """
+    Resolve a timezone name once and reuse the tzinfo object.
+    
+    Args:
+        name: Timezone name (e.g. "America/New_York")
+        
+    Returns:
+        The tzinfo object, or None if the timezone is unknown
+    """
+    try:
+        return _load_timezone(name)
+    except (_UnknownTimeZoneError, ValueError):
+        return None
 
 
 def format_time_remaining(time_remaining: Union[str, int, float, datetime.timedelta]) -> str:
@@ -17,31 +43,25 @@ def format_time_remaining(time_remaining: Union[str, int, float, datetime.timede
     Returns:
         Formatted string like "0 days, 2 hours, 30 minutes, 23 seconds"
     """
-    # Convert to timedelta if it's seconds as a number or string
+    # Get whole seconds directly; only a timedelta input needs converting
     if isinstance(time_remaining, (int, float)):
-        td = datetime.timedelta(seconds=time_remaining)
+        total_seconds = int(time_remaining)
     elif isinstance(time_remaining, str) and time_remaining.isdigit():
-        td = datetime.timedelta(seconds=int(time_remaining))
+        total_seconds = int(time_remaining)
     elif isinstance(time_remaining, datetime.timedelta):
-        td = time_remaining
+        total_seconds = int(time_remaining.total_seconds())
     else:
         # If it's already a formatted string or unknown format, return as is
         return str(time_remaining)
     
     # Calculate components
-    total_seconds = int(td.total_seconds())
     days, remainder = divmod(total_seconds, 86400)  # 86400 seconds in a day
     hours, remainder = divmod(remainder, 3600)      # 3600 seconds in an hour
     minutes, seconds = divmod(remainder, 60)        # 60 seconds in a minute
     
-    # Format with pluralization
-    day_text = f"{days} day{'s' if days != 1 else ''}"
-    hour_text = f"{hours} hour{'s' if hours != 1 else ''}"
-    minute_text = f"{minutes} min"
-    second_text = f"{seconds} sec"
-
-    # Combine both formats
-    return f"{day_text}, {hour_text}, {minute_text}, {second_text}"
+    # Format with pluralization in a single string build
+    return (f"{days} day{'' if days == 1 else 's'}, {hours} hour{'' if hours == 1 else 's'}, "
+            f"{minutes} min, {seconds} sec")
 
 
 def format_timestamp(timestamp: Union[int, float, datetime.datetime], 
@@ -73,27 +93,42 @@ def format_timestamp(timestamp: Union[int, float, datetime.datetime],
     
     # Convert to the specified timezone if provided
     if timezone:
-        try:
-            target_tz = pytz.timezone(timezone)
+        target_tz = _get_timezone(timezone)
+        # If timezone is invalid, keep as is
+        if target_tz is not None:
             dt = dt.astimezone(target_tz)
-        except pytz.exceptions.UnknownTimeZoneError:
-            # If timezone is invalid, keep as is
-            pass
     
-    # Format based on type
-    if format_type == "iso":
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
-    elif format_type == "human":
-        # Format like "Sun Apr 6, 11:57 PM"
-        return dt.strftime("%a %b %-d, %I:%M %p").replace(" 0", " ")
-    elif format_type == "both":
-        iso_format = dt.strftime("%Y-%m-%d %H:%M:%S")
-        human_format = dt.strftime("%a %b %-d, %I:%M %p").replace(" 0", " ")
-        return f"{iso_format} | {human_format}"
+    # Format based on type; the output only has second resolution, so key the
+    # cached formatter on the wall-clock time truncated to the second
+    if format_type in ("iso", "human", "both"):
+        return _format_wall_time(dt.replace(microsecond=0, tzinfo=None), format_type)
     else:
         return dt.isoformat()
 
 
+@lru_cache(maxsize=32)
+def _format_wall_time(wall_time: datetime.datetime, format_type: str) -> str:
+    """
+    Format a naive wall-clock time, reusing the result for repeated renders within a second.
+    
+    Args:
+        wall_time: Naive datetime already converted to the display timezone
+        format_type: Format type ("iso", "human", "both")
+        
+    Returns:
+        Formatted timestamp string
+    """
+    iso_format = wall_time.strftime("%Y-%m-%d %H:%M:%S")
+    if format_type == "iso":
+        return iso_format
+    
+    # Format like "Sun Apr 6, 11:57 PM" (no leading zero on day or hour)
+    human_format = f"{wall_time:%a %b} {wall_time.day}, {wall_time.hour % 12 or 12}:{wall_time:%M %p}"
+    if format_type == "human":
+        return human_format
+    return f"{iso_format} | {human_format}"
+
+
 def convert_timezone(dt: datetime.datetime, 
                     target_timezone: str) -> datetime.datetime:
     """
@@ -111,12 +146,11 @@ def convert_timezone(dt: datetime.datetime,
         dt = dt.replace(tzinfo=datetime.timezone.utc)
     
     # Convert to the target timezone
-    try:
-        target_tz = pytz.timezone(target_timezone)
-        return dt.astimezone(target_tz)
-    except pytz.exceptions.UnknownTimeZoneError:
+    target_tz = _get_timezone(target_timezone)
+    if target_tz is None:
         # If timezone is invalid, return original
         return dt
+    return dt.astimezone(target_tz)
 
 
 def ensure_utc(dt: Union[datetime.datetime, int, float]) -> datetime.datetime:
@@ -152,14 +186,23 @@ def get_current_time(timezone: Optional[str] = None) -> datetime.datetime:
     current_time = datetime.datetime.now(datetime.timezone.utc)
     
     if timezone:
-        try:
-            target_tz = pytz.timezone(timezone)
+        target_tz = _get_timezone(timezone)
+        if target_tz is not None:
             return current_time.astimezone(target_tz)
-        except pytz.exceptions.UnknownTimeZoneError:
-            pass
     
     return current_time
 
+# ANSI codes used by the color helpers below, for callers that build a colored
+# string in a single f-string instead of formatting it and then wrapping it
+C_GREEN = "\033[92m"
+C_YELLOW = "\033[93m"
+C_RED = "\033[91m"
+C_BLUE = "\033[94m"
+C_BOLD_GREEN = "\033[1;92m"
+C_BOLD_YELLOW = "\033[1;93m"
+C_BRIGHT_CYAN = "\033[96m"
+C_NC = "\033[0m"
+
 def colorize(text, color_code):
     """Add color to terminal output.
 
@@ -167,46 +210,46 @@ def colorize(text, color_code):
         text (str): The text to be colorized.
         color_code (str): The ANSI color code as a string (e.g., "31" for red, "32" for green).
     """
-    return f"\033[{color_code}m{text}\033[0m"
+    return f"\033[{color_code}m{text}{C_NC}"
 
 def green(text):
     """Format text as green."""
     if text is None:
         text = ""
-    return f"\033[92m{text}\033[0m"
+    return f"{C_GREEN}{text}{C_NC}"
 
 def yellow(text):
     """Format text as yellow."""
     if text is None:
         text = ""
-    return f"\033[93m{text}\033[0m"
+    return f"{C_YELLOW}{text}{C_NC}"
 
 def red(text):
     """Format text as red."""
     if text is None:
         text = ""
-    return f"\033[91m{text}\033[0m"
+    return f"{C_RED}{text}{C_NC}"
 
 def blue(text):
     """Format text as blue."""
     if text is None:
         text = ""
-    return f"\033[94m{text}\033[0m"
+    return f"{C_BLUE}{text}{C_NC}"
 
 def bold_green(text):
     """Format text as bold green."""
     if text is None:
         text = ""
-    return f"\033[1;92m{text}\033[0m"
+    return f"{C_BOLD_GREEN}{text}{C_NC}"
 
 def bold_yellow(text):
     """Format text as bold yellow."""
     if text is None:
         text = ""
-    return f"\033[1;93m{text}\033[0m"
+    return f"{C_BOLD_YELLOW}{text}{C_NC}"
 
 def bright_cyan(text):
     """Format text as bright cyan."""
     if text is None:
         text = ""
-    return f"\033[96m{text}\033[0m"
\ No newline at end of file
+    return f"{C_BRIGHT_CYAN}{text}{C_NC}"
\ No newline at end of file
@@ -4,17 +4,32 @@ import os
 import sys
 import datetime
 import time
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
-from thw_nodekit.toolkit.core.utils import green, red, bold_yellow, bright_cyan, bold_green
+from thw_nodekit.toolkit.core.utils import bold_yellow, bright_cyan, bold_green
+from thw_nodekit.toolkit.core.utils import C_GREEN, C_RED, C_BRIGHT_CYAN, C_NC
 from thw_nodekit.toolkit.display.constants import APP_NAME
 
+
+@lru_cache(maxsize=1)
+def _format_local_time(epoch_second: int) -> str:
+    """Format a whole-second Unix time as local time; repeated frames within a second reuse it."""
+    return datetime.datetime.fromtimestamp(epoch_second).strftime('%Y-%m-%d %H:%M:%S')
+
+
 class BaseTrackerDisplay:
     """Base class for tracker displays with common formatting methods."""
     
-    def clear_screen(self):
-        """Clear terminal screen in a cross-platform way."""
-        os.system('cls' if sys.platform == "win32" else 'clear')
+    # Chosen once at import: ANSI terminals are cleared in-process instead of spawning 'clear'
+    if sys.platform == "win32":
+        def clear_screen(self):
+            """Clear terminal screen (legacy Windows consoles may not handle ANSI escapes)."""
+            os.system('cls')
+    else:
+        def clear_screen(self):
+            """Clear terminal screen and move the cursor home."""
+            print("\033[2J\033[H", end="", flush=True)
     
     def create_header(self, title):
         """Create a standardized header."""
@@ -26,11 +41,11 @@ class BaseTrackerDisplay:
     
     def format_label(self, label, width=18):
         """Format a label with consistent width."""
-        return f"{bright_cyan(label.ljust(width))}"
+        return f"{C_BRIGHT_CYAN}{label.ljust(width)}{C_NC}"
     
     def format_timestamp(self):
         """Format current timestamp."""
-        return datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        return _format_local_time(int(time.time()))
     
     def format_cache_age(self, cache_ages):
         """Format cache age information."""
@@ -40,18 +55,19 @@ class BaseTrackerDisplay:
     
     def format_delta(self, value, positive_is_good=True):
         """Format delta values with appropriate colors."""
+        # Color and value are formatted in one f-string rather than wrapped afterwards
         if value > 0:
-            return green(f" (+{value})") if positive_is_good else red(f" (+{value})")
+            return f"{C_GREEN if positive_is_good else C_RED} (+{value}){C_NC}"
         elif value < 0:
-            return red(f" ({value})") if positive_is_good else green(f" ({value})")
+            return f"{C_RED if positive_is_good else C_GREEN} ({value}){C_NC}"
         return " (+0)"
     
     def format_credit_diff(self, value, positive_is_good=False):
         """Format credit difference without parentheses."""
         if value > 0:
-            return green(f"+{value}") if positive_is_good else red(f"+{value}")
+            return f"{C_GREEN if positive_is_good else C_RED}+{value}{C_NC}"
         elif value < 0:
-            return red(f"{value}") if positive_is_good else green(f"{value}")
+            return f"{C_RED if positive_is_good else C_GREEN}{value}{C_NC}"
         return "+0"
     
     def format_name(self, name: str, max_length: int = 25) -> str:
@@ -114,6 +114,13 @@ class TVCTrackerDisplay(BaseTrackerDisplay):
             width=width
         )
     
+    def _create_label_value_table(self) -> Table:
+        """Create a label/value table; the label style is set once on the column, not per cell."""
+        table = self._create_basic_table()
+        table.add_column(style=STYLE_BRIGHT_CYAN)
+        table.add_column()
+        return table
+    
     def _format_delta_text(
         self, 
         value: int, 
@@ -338,31 +345,31 @@ class TVCTrackerDisplay(BaseTrackerDisplay):
         validator_name = data["validator_name"]
         version = data.get("version", "Unknown")
         
-        validator_table = self._create_basic_table()
+        validator_table = self._create_label_value_table()
         
         # Add rows with labels and values - ONLY validator specific info
         validator_table.add_row(
-            Text("Validator Name:", style=STYLE_BRIGHT_CYAN), 
+            "Validator Name:", 
             Text(validator_name, style=STYLE_GREEN_BOLD)
         )
         validator_table.add_row(
-            Text("Identity Pubkey:", style=STYLE_BRIGHT_CYAN), 
+            "Identity Pubkey:", 
             Text(validator_identity)
         )
         
         vote_pubkey = validator.get("votePubkey", "Unknown")
         validator_table.add_row(
-            Text("Vote Pubkey:", style=STYLE_BRIGHT_CYAN), 
+            "Vote Pubkey:", 
             Text(vote_pubkey)
         )
         
         validator_table.add_row(
-            Text("Active Stake:", style=STYLE_BRIGHT_CYAN), 
+            "Active Stake:", 
             Text(f"{int(validator.get('activatedStake', 0)) / 1_000_000_000:,.2f} ◎")
         )
         
         validator_table.add_row(
-            Text("Version:", style=STYLE_BRIGHT_CYAN), 
+            "Version:", 
             Text(version)
         )
 
@@ -384,7 +391,7 @@ class TVCTrackerDisplay(BaseTrackerDisplay):
         network = "mainnet" if data.get("cluster_type") == "Mainnet" else "testnet"
         validators_app_url = f"https://www.validators.app/validators/{validator_identity}?locale=en&network={network}"
         table.add_row(
-            Text("Validators.app:", style=STYLE_BRIGHT_CYAN), 
+            "Validators.app:", 
             Text.from_markup(f"[link={validators_app_url}]View on Validators.app[/link]", style=STYLE_LINK)
         )
         
@@ -393,7 +400,7 @@ class TVCTrackerDisplay(BaseTrackerDisplay):
             cluster_param = "?cluster=testnet" if data.get("cluster_type") != "Mainnet" else ""
             svt_url = f"https://svt.one/dashboard/{vote_pubkey}{cluster_param}"
             table.add_row(
-                Text("SVT.one:", style=STYLE_BRIGHT_CYAN), 
+                "SVT.one:", 
                 Text.from_markup(f"[link={svt_url}]View on SVT.one[/link]", style=STYLE_LINK)
             )
             
@@ -401,7 +408,7 @@ class TVCTrackerDisplay(BaseTrackerDisplay):
             if data.get("cluster_type") == "Mainnet":
                 stakewiz_url = f"https://stakewiz.com/validator/{vote_pubkey}"
                 table.add_row(
-                    Text("StakeWiz:", style=STYLE_BRIGHT_CYAN),
+                    "StakeWiz:",
                     Text.from_markup(f"[link={stakewiz_url}]View on StakeWiz[/link]", style=STYLE_LINK)
                 )
     
@@ -420,26 +427,26 @@ class TVCTrackerDisplay(BaseTrackerDisplay):
         asn = ip_info.get("asn", "Unknown")
         organization = ip_info.get("org_name", "Unknown")
         
-        geolocation_table = self._create_basic_table()
+        geolocation_table = self._create_label_value_table()
         
         # Add geolocation rows
-        geolocation_table.add_row(Text("IP Address:", style=STYLE_BRIGHT_CYAN), Text(ip_address))
-        geolocation_table.add_row(Text("Location:", style=STYLE_BRIGHT_CYAN), Text(ip_location))
-        geolocation_table.add_row(Text("Datacenter:", style=STYLE_BRIGHT_CYAN), Text(va_format))
-        geolocation_table.add_row(Text("ASN:", style=STYLE_BRIGHT_CYAN), Text(asn))
-        geolocation_table.add_row(Text("ASO:", style=STYLE_BRIGHT_CYAN), Text(organization))
+        geolocation_table.add_row("IP Address:", Text(ip_address))
+        geolocation_table.add_row("Location:", Text(ip_location))
+        geolocation_table.add_row("Datacenter:", Text(va_format))
+        geolocation_table.add_row("ASN:", Text(asn))
+        geolocation_table.add_row("ASO:", Text(organization))
         
         # Add IPInfo link
         ipinfo_url = f"https://ipinfo.io/{ip_address}"
         geolocation_table.add_row(
-            Text("IPInfo:", style=STYLE_BRIGHT_CYAN),
+            "IPInfo:",
             Text.from_markup(f"[link={ipinfo_url}]View on IPInfo[/link]", style=STYLE_LINK)
         )
         
         # Add Ping Test link
         ping_test_url = f"https://ping.pe/{ip_address}"
         geolocation_table.add_row(
-            Text("Ping Test:", style=STYLE_BRIGHT_CYAN),
+            "Ping Test:",
             Text.from_markup(f"[link={ping_test_url}]View Ping Test[/link]", style=STYLE_LINK)
         )
         
@@ -450,7 +457,7 @@ class TVCTrackerDisplay(BaseTrackerDisplay):
         """Update the epoch information panel."""
         metrics = data["epoch_metrics"]
         
-        epoch_table = self._create_basic_table()
+        epoch_table = self._create_label_value_table()
         
         # Create a visual progress bar
         progress_percent = metrics['percent_complete']
@@ -465,17 +472,17 @@ class TVCTrackerDisplay(BaseTrackerDisplay):
         progress_bar.append(f" {progress_percent:.4f} %")
         
         # Add rows with epoch data
-        epoch_table.add_row(Text("Current Epoch:", style=STYLE_BRIGHT_CYAN), str(metrics["epoch"]))
-        epoch_table.add_row(Text("Percent Complete:", style=STYLE_BRIGHT_CYAN), progress_bar)
-        epoch_table.add_row(Text("Slots Complete:", style=STYLE_BRIGHT_CYAN), f"{metrics['slot_index']} / {metrics['slots_in_epoch']} ({metrics['remaining_slots']} remaining)")
-        epoch_table.add_row(Text("Avg Slot Time:", style=STYLE_BRIGHT_CYAN), f"{metrics['avg_slot_time']:.4f} seconds")
+        epoch_table.add_row("Current Epoch:", str(metrics["epoch"]))
+        epoch_table.add_row("Percent Complete:", progress_bar)
+        epoch_table.add_row("Slots Complete:", f"{metrics['slot_index']} / {metrics['slots_in_epoch']} ({metrics['remaining_slots']} remaining)")
+        epoch_table.add_row("Avg Slot Time:", f"{metrics['avg_slot_time']:.4f} seconds")
         # epoch_table.add_row(Text("Estimated End:", style=STYLE_BRIGHT_CYAN), Text(f"{metrics['estimated_end_time'].strftime('%Y-%m-%d %H:%M:%S')} | {metrics['estimated_end_time'].strftime('%a %b %d, %I:%M %p').replace(' 0', ' ').replace(':0', ':')}"))
         
         # Ensure estimated end time is in UTC
         est_end_time_utc = ensure_utc(metrics['estimated_end_time'])
         
         # Add UTC time (ISO format)
-        utc_label = Text("Est. End Time (UTC):", style=STYLE_BRIGHT_CYAN)
+        utc_label = "Est. End Time (UTC):"
         utc_iso = Text(format_timestamp(est_end_time_utc, format_type="iso"))
         epoch_table.add_row(utc_label, utc_iso)
 
@@ -485,7 +492,7 @@ class TVCTrackerDisplay(BaseTrackerDisplay):
         
         # Convert to EST and add EST time (ISO format)
         est_end_time_est = convert_timezone(est_end_time_utc, "America/New_York")
-        est_label = Text("Est. End Time (EST):", style=STYLE_BRIGHT_CYAN)
+        est_label = "Est. End Time (EST):"
         est_iso = Text(format_timestamp(est_end_time_est, format_type="iso"))
         epoch_table.add_row(est_label, est_iso)
 
@@ -493,7 +500,7 @@ class TVCTrackerDisplay(BaseTrackerDisplay):
         est_human = Text(format_timestamp(est_end_time_est, format_type="human"))
         epoch_table.add_row(est_label, est_human)
 
-        epoch_table.add_row(Text("Time Remaining:", style=STYLE_BRIGHT_CYAN), format_time_remaining(metrics.get("time_remaining_seconds", metrics["time_remaining"])))
+        epoch_table.add_row("Time Remaining:", format_time_remaining(metrics.get("time_remaining_seconds", metrics["time_remaining"])))
         # epoch_table.add_row(Text(" "))
 
         # Create panel using the same method as other panels
@@ -505,31 +512,31 @@ class TVCTrackerDisplay(BaseTrackerDisplay):
         # Get leader metrics - first check if new format metrics are available
         leader_metrics = data.get("leader_metrics", {})
         
-        leader_table = self._create_basic_table()
+        leader_table = self._create_label_value_table()
         
         # Add leader info rows
         leader_table.add_row(
-            Text("Total Leader Slots:", style=STYLE_BRIGHT_CYAN), 
+            "Total Leader Slots:", 
             Text(f"{leader_metrics.get('leader_slots_total', 0)} slots")
         )
         
         leader_table.add_row(
-            Text("Completed Leader Slots:", style=STYLE_BRIGHT_CYAN), 
+            "Completed Leader Slots:", 
             Text(f"{leader_metrics.get('leader_slots_completed', 0)} slots")
         )
         
         leader_table.add_row(
-            Text("Upcoming Leader Slots:", style=STYLE_BRIGHT_CYAN), 
+            "Upcoming Leader Slots:", 
             Text(f"{len(leader_metrics.get('leader_slots_upcoming', []))} slots")
         )
         
         leader_table.add_row(
-            Text("Blocks Produced:", style=STYLE_BRIGHT_CYAN), 
+            "Blocks Produced:", 
             Text(f"{leader_metrics.get('blocks_produced', 'N/A')}")
         )
         
         leader_table.add_row(
-            Text("Slots Skipped:", style=STYLE_BRIGHT_CYAN), 
+            "Slots Skipped:", 
             Text(f"{leader_metrics.get('leader_slots_skipped', 'N/A')}")
         )
         
@@ -537,7 +544,7 @@ class TVCTrackerDisplay(BaseTrackerDisplay):
         skip_rate = leader_metrics.get('skip_rate', 0)
         skip_rate_style = STYLE_RED if skip_rate > 0 else STYLE_GREEN
         leader_table.add_row(
-            Text("Skip Rate:", style=STYLE_BRIGHT_CYAN), 
+            "Skip Rate:", 
             Text(f"{skip_rate:.2f}%", style=skip_rate_style)
         )
 
@@ -545,7 +552,7 @@ class TVCTrackerDisplay(BaseTrackerDisplay):
         next_slot = leader_metrics.get('leader_slot_next')
         if next_slot is not None:
             leader_table.add_row(
-                Text("Next Leader Slot:", style=STYLE_BRIGHT_CYAN), 
+                "Next Leader Slot:", 
                 Text(f"{next_slot}")
             )
             
@@ -556,7 +563,7 @@ class TVCTrackerDisplay(BaseTrackerDisplay):
                 next_time_utc = ensure_utc(next_time)
                 
                 # Display UTC time (ISO format)
-                utc_label = Text("Next Leader Time (UTC):", style=STYLE_BRIGHT_CYAN)
+                utc_label = "Next Leader Time (UTC):"
                 utc_iso = Text(format_timestamp(next_time_utc, format_type="iso"))
                 leader_table.add_row(utc_label, utc_iso)
 
@@ -566,7 +573,7 @@ class TVCTrackerDisplay(BaseTrackerDisplay):
 
                 # Convert to EST and display (ISO format)
                 next_time_est = convert_timezone(next_time_utc, "America/New_York")
-                est_label = Text("Next Leader Time (EST):", style=STYLE_BRIGHT_CYAN)
+                est_label = "Next Leader Time (EST):"
                 est_iso = Text(format_timestamp(next_time_est, format_type="iso"))
                 leader_table.add_row(est_label, est_iso)
 
@@ -578,7 +585,7 @@ class TVCTrackerDisplay(BaseTrackerDisplay):
                 time_remaining = leader_metrics.get('leader_slot_time_remaining')
                 if time_remaining is not None:
                     leader_table.add_row(
-                        Text("Time Until Next:", style=STYLE_BRIGHT_CYAN), 
+                        "Time Until Next:", 
                         Text(format_time_remaining(time_remaining))
                     )
         
@@ -6,6 +6,7 @@ import json
 import os
 import datetime
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, List, Any, Tuple
 from thw_nodekit.toolkit.core.ip_tools import get_ip_info
 from thw_nodekit.toolkit.core.rpc_api import (
@@ -47,6 +48,9 @@ class TVCTracker:
         # Lock for thread-safe data access
         self.data_lock = threading.RLock()
         
+        # Workers for refreshing expired data types in parallel
+        self._fetch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tvc-fetch")
+        
         # Cached data with timestamp - centralized storage
         self.cache = {
             # High-frequency data (sub-second updates)
@@ -112,14 +116,10 @@ class TVCTracker:
         Thread-safe implementation with proper locking.
         """
         with self.data_lock:
-            cache_entry = self.cache[data_type]
             current_time = time.time()
             
-            # Get TTL for this data type
-            ttl = self.ttl.get(data_type, 30)  # Default 30 seconds
-            
             # Refresh if cache is expired or empty
-            if cache_entry["data"] is None or (current_time - cache_entry["timestamp"]) > ttl:
+            if self._is_expired(data_type, current_time):
                 try:
                     data = refresh_func(*args, **kwargs)
                     self.cache[data_type] = {
@@ -127,22 +127,64 @@ class TVCTracker:
                         "timestamp": current_time
                     }
                 except Exception as e:
-                    error_msg = f"Error refreshing {data_type}: {e}"
-                    print(error_msg)
-                    # Keep existing data if there's an error and it exists
-                    if cache_entry["data"] is None:
-                        # Initialize with empty data structure appropriate for type
-                        if data_type == "vote_accounts":
-                            self.cache[data_type]["data"] = []
-                        elif data_type in ["cluster_nodes", "validator_info"]:
-                            self.cache[data_type]["data"] = []
-                        elif data_type == "ip_info":
-                            self.cache[data_type]["data"] = {}
-                        else:
-                            self.cache[data_type]["data"] = {}
+                    self._handle_refresh_error(data_type, e)
                 
         return self.cache[data_type]["data"]
     
+    def _is_expired(self, data_type: str, current_time: float) -> bool:
+        """Check whether a cached data type is empty or older than its TTL."""
+        cache_entry = self.cache[data_type]
+        ttl = self.ttl.get(data_type, 30)  # Default 30 seconds
+        return cache_entry["data"] is None or (current_time - cache_entry["timestamp"]) > ttl
+    
+    def _handle_refresh_error(self, data_type: str, error: Exception) -> None:
+        """Report a failed refresh, keeping existing data or falling back to an empty value."""
+        error_msg = f"Error refreshing {data_type}: {error}"
+        print(error_msg)
+        # Keep existing data if there's an error and it exists
+        if self.cache[data_type]["data"] is None:
+            # Initialize with empty data structure appropriate for type
+            if data_type in ["vote_accounts", "cluster_nodes", "validator_info"]:
+                self.cache[data_type]["data"] = []
+            else:
+                self.cache[data_type]["data"] = {}
+    
+    def _refresh_concurrently(self, refreshers: List[Tuple[Any, Any]]) -> None:
+        """Refresh all expired data types in parallel so their RPC round trips overlap.
+        
+        Args:
+            refreshers: List of (data_type, refresh_func) pairs; refresh functions take no arguments.
+                data_type may be a tuple of data types filled by one fetch, in which case
+                refresh_func returns a tuple of results in the same order.
+        """
+        refreshers = [
+            (data_types if isinstance(data_types, tuple) else (data_types,), func)
+            for data_types, func in refreshers
+        ]
+        current_time = time.time()
+        with self.data_lock:
+            expired = [(data_types, func) for data_types, func in refreshers
+                       if any(self._is_expired(data_type, current_time) for data_type in data_types)]
+        
+        # The lock is not held while fetching, so refresh functions may read other cached data
+        futures = [(data_types, self._fetch_executor.submit(func)) for data_types, func in expired]
+        for data_types, future in futures:
+            try:
+                results = future.result()
+            except Exception as e:
+                with self.data_lock:
+                    for data_type in data_types:
+                        self._handle_refresh_error(data_type, e)
+            else:
+                if len(data_types) == 1:
+                    results = (results,)
+                with self.data_lock:
+                    for data_type, data in zip(data_types, results):
+                        self.cache[data_type] = {
+                            "data": data,
+                            "timestamp": current_time
+                        }
+    
     def _fetch_vote_accounts(self):
         """Fetch and process validators data with proper filtering."""
         try:
@@ -152,8 +194,13 @@ class TVCTracker:
             if not validators:
                 return []
                 
-            # Get current epoch for filtering
-            epoch_info = self._get_cached_data("epoch_info", self._fetch_epoch_info)
+            # Get current epoch for filtering. Read it from the cache without refreshing:
+            # epoch_info is refreshed alongside this fetch, and the epoch number only
+            # changes every few days. Fetch it (outside data_lock) only before first use.
+            with self.data_lock:
+                epoch_info = self.cache["epoch_info"]["data"]
+            if not epoch_info:
+                epoch_info = self._fetch_epoch_info()
             current_epoch = epoch_info.get("epoch", 0)
             
             # Filter for validators with current epoch data
@@ -185,10 +232,10 @@ class TVCTracker:
         client = get_client(self.cluster)
         return client.methods.get_epoch_info()
     
-    def _fetch_slot(self):
-        """Fetch current slot."""
+    def _fetch_slot_and_epoch_info(self):
+        """Fetch current slot and epoch info in one batched round trip."""
         client = get_client(self.cluster)
-        return client.methods.get_slot()
+        return client.methods.get_slot_and_epoch_info()
     
     def _fetch_leader_schedule(self):
         """Fetch leader schedule."""
@@ -216,25 +263,27 @@ class TVCTracker:
         This method can be called frequently and will only refresh data
         when its TTL has expired. Returns True if any data was updated.
         """
-        any_updated = False
-        
-        # Update high-frequency data
-        if self._get_cached_data("vote_accounts", self._fetch_vote_accounts) is not None:
-            any_updated = True
-        
-        if self._get_cached_data("epoch_info", self._fetch_epoch_info) is not None:
-            any_updated = True
-        
-        if self._get_cached_data("slot", self._fetch_slot) is not None:
-            any_updated = True
-        
-        # Update medium-frequency data
-        self._get_cached_data("leader_schedule", self._fetch_leader_schedule)
-        self._get_cached_data("block_production", self._fetch_block_production)
+        # Refresh every expired data type at once; the fetches are independent network calls
+        self._refresh_concurrently([
+            # High-frequency data
+            ("vote_accounts", self._fetch_vote_accounts),
+            (("slot", "epoch_info"), self._fetch_slot_and_epoch_info),
+            
+            # Medium-frequency data
+            ("leader_schedule", self._fetch_leader_schedule),
+            ("block_production", self._fetch_block_production),
+            
+            # Low-frequency data
+            ("cluster_nodes", self._fetch_cluster_nodes),
+            ("validator_info", self._fetch_validator_info),
+        ])
         
-        # Update low-frequency data
-        cluster_nodes = self._get_cached_data("cluster_nodes", self._fetch_cluster_nodes)
-        self._get_cached_data("validator_info", self._fetch_validator_info)
+        with self.data_lock:
+            any_updated = any(
+                self.cache[data_type]["data"] is not None
+                for data_type in ("vote_accounts", "epoch_info", "slot")
+            )
+            cluster_nodes = self.cache["cluster_nodes"]["data"]
         
         # Update IP info if we have cluster nodes
         if cluster_nodes: